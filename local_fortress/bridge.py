@@ -7,27 +7,48 @@ Takes JSON input commands and returns JSON responses.
 import sys
 import os
 import json
-import argparse
 import traceback
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add local_fortress to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from mcp_server.agent_config import get_agent_config, AgentConfigLoader
-from mcp_server.verification_config import get_verification_config, set_verification_mode, VerificationMode
-from mcp_server.identity_manager import IdentityManager
-from mcp_server.trust_engine import TrustEngine
 import sqlite3
 
+# Resolved once: per-call Path(__file__) reconstruction is pure overhead
+_MODULE_DIR = Path(__file__).parent
+_KEYSTORE_DIR = _MODULE_DIR / "keystore"
+_LEDGER_DB = _MODULE_DIR / "ledger" / "qorelogic_soa_ledger.db"
+
+# Optional fast JSON codec: orjson is ~3-10x faster than stdlib json in
+# both directions. Fall back silently when it isn't installed.
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# Each handler imports only the backend modules it needs: the bridge runs
+# as a one-shot subprocess, so eagerly importing the crypto + trust stack
+# here would tax every invocation regardless of the requested action.
+
 def handle_get_verification_config(args):
+    from mcp_server.verification_config import get_verification_config
     config = get_verification_config()
     return {"success": True, "config": config.to_dict()}
 
 def handle_set_verification_config(args):
-    payload = json.loads(args.payload)
+    from mcp_server.verification_config import set_verification_mode, VerificationMode
+    payload = json_loads(args.payload)
     mode_str = payload.get("mode", "lite").lower()
-    
+
     try:
         mode = VerificationMode(mode_str)
         success = set_verification_mode(mode)
@@ -35,60 +56,160 @@ def handle_set_verification_config(args):
     except ValueError:
         return {"success": False, "error": f"Invalid mode: {mode_str}"}
 
+# Trust status TTL cache: scores don't change per-second, and the
+# Dashboard polls this action, so skip redundant registry queries.
+_TRUST_STATUS_TTL = 5.0
+_trust_status_cache = {}
+
+def _get_trust_snapshot(agent):
+    """Fetch (score, stage, influence_weight) for a DID in one query."""
+    from mcp_server.trust_engine import TrustEngine
+
+    import time
+    now = time.monotonic()
+    cached = _trust_status_cache.get(agent)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    db_path = _LEDGER_DB
+    snapshot = None
+    if db_path.exists():
+        row = _get_ledger_conn(db_path).execute(
+            "SELECT trust_score, influence_weight FROM agent_registry WHERE did = ?",
+            (agent,)
+        ).fetchone()
+        if row is not None:
+            score = row[0]
+            stage = TrustEngine().get_trust_stage(score)
+            snapshot = (score, stage, row[1])
+
+    _trust_status_cache[agent] = (now + _TRUST_STATUS_TTL, snapshot)
+    return snapshot
+
 def handle_get_trust_status(args):
     # Retrieve trust status for an agent (default sentinel)
     agent = "did:myth:sentinel" # Default for single-agent view
     if args.payload:
-        data = json.loads(args.payload)
+        data = json_loads(args.payload)
         agent = data.get("did", agent)
-        
-    engine = TrustEngine()
-    score = engine.get_limit(agent, 1.0) # Actually get_limit calculates trust indirectly? 
-    # TrustEngine doesn't have a simple "get_score" method exposed directly in previous diffs?
-    # Checking trust_engine source...
-    # It has get_trust_score(did)
-    
-    score = engine.get_trust_score(agent)
-    stage_info = engine.get_trust_stage(agent)
-    
+
+    snapshot = _get_trust_snapshot(agent)
+    if snapshot is None:
+        return {
+            "success": True,
+            "did": agent,
+            "score": None,
+            "stage": "UNKNOWN",
+            "stage_multiplier": 1.0
+        }
+
+    score, stage, weight = snapshot
     return {
         "success": True,
         "did": agent,
         "score": score,
-        "stage": stage_info[0].name if stage_info else "UNKNOWN",
-        "stage_multiplier": stage_info[1] if stage_info else 1.0
+        "stage": stage.name,
+        "stage_multiplier": weight if weight is not None else 1.0
     }
 
-from mcp_server.trust_manager import get_trust_manager
+# Pooled ledger connection: the bridge may be invoked many times per session,
+# so keep one warm connection (WAL + warm page cache) instead of paying the
+# file-open cost on every query.
+import threading
+
+_ledger_conn = None
+_ledger_lock = threading.Lock()
+
+# Fixed query text so sqlite3's built-in statement cache (cached_statements)
+# reuses the compiled VDBE program instead of re-parsing per call. Explicit
+# column list lets the timestamp index drive the ORDER BY + LIMIT.
+LEDGER_QUERY = """
+    SELECT entry_id, timestamp, agent_did, model_version, trust_score,
+           event_type, risk_grade, payload, verification_method,
+           verification_result, workspace_id, gdpr_art22_trigger,
+           human_approver, entry_hash, prev_hash, signature
+    FROM soa_ledger ORDER BY timestamp DESC LIMIT 50
+"""
+
+# Column names for LEDGER_QUERY; the schema is stable, so skip the
+# cur.description round-trip per call
+LEDGER_COLS = (
+    "entry_id", "timestamp", "agent_did", "model_version", "trust_score",
+    "event_type", "risk_grade", "payload", "verification_method",
+    "verification_result", "workspace_id", "gdpr_art22_trigger",
+    "human_approver", "entry_hash", "prev_hash", "signature"
+)
+
+def _get_ledger_conn(db_path):
+    """Return the shared ledger connection, creating it on first use."""
+    global _ledger_conn
+    if _ledger_conn is None:
+        with _ledger_lock:
+            if _ledger_conn is None:
+                conn = sqlite3.connect(str(db_path), check_same_thread=False,
+                                       cached_statements=128)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA cache_size=-20000")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_soa_ts ON soa_ledger(timestamp DESC)")
+                _ledger_conn = conn
+    return _ledger_conn
+
+# Keystore listing cache: the directory only changes on key rotation, so
+# key the parsed entries by the newest mtime seen during the scan.
+_keystore_cache = (None, None)
+
+def _scan_keystore(keystore_dir):
+    """Scan keystore dir for *.key files, cached by latest entry mtime."""
+    global _keystore_cache
+    entries = []
+    newest = 0
+    try:
+        with os.scandir(keystore_dir) as it:
+            for e in it:
+                if e.name.endswith(".key") and e.is_file(follow_symlinks=False):
+                    entries.append(e.path)
+                    mtime = e.stat().st_mtime_ns
+                    if mtime > newest:
+                        newest = mtime
+    except FileNotFoundError:
+        return {}
+
+    sig = (len(entries), newest)
+    if _keystore_cache[0] == sig:
+        return dict(_keystore_cache[1])
+
+    identities = {}
+    for path in entries:
+        try:
+            with open(path, 'rb') as f:
+                data = json_loads(f.read())
+            did = data.get("did")
+            if did:
+                identities[did] = {
+                    "did": did,
+                    "role": data.get("role", "Unknown"),
+                    "created_at": data.get("created_at"),
+                    "algorithm": data.get("kdf_algorithm", "pbkdf2"),
+                    "is_local": True
+                }
+        except:
+            pass
+    _keystore_cache = (sig, identities)
+    return dict(identities)
 
 def handle_list_identities(args):
     """
     List identities enriched with Trust Dynamics data (Score, Stage, Weight).
     """
     # Scan keystore for physical keys
-    keystore_dir = Path(__file__).parent / "keystore"
-    identities = {}
-    
-    if keystore_dir.exists():
-        for keyfile in keystore_dir.glob("*.key"):
-            try:
-                with open(keyfile, 'r') as f:
-                    data = json.load(f)
-                    did = data.get("did")
-                    if did:
-                        identities[did] = {
-                            "did": did,
-                            "role": data.get("role", "Unknown"),
-                            "created_at": data.get("created_at"),
-                            "algorithm": data.get("kdf_algorithm", "pbkdf2"),
-                            "is_local": True
-                        }
-            except:
-                pass
+    identities = _scan_keystore(_KEYSTORE_DIR)
 
     # Enrich with Trust Registry Data (SQL)
     try:
-        db_path = Path(__file__).parent / "ledger" / "qorelogic_soa_ledger.db"
+        from mcp_server.trust_manager import get_trust_manager
+        db_path = _LEDGER_DB
         tm = get_trust_manager(str(db_path))
         
         with sqlite3.connect(db_path) as conn:
@@ -129,7 +250,8 @@ def handle_list_identities(args):
     return {"success": True, "identities": list(identities.values())}
 
 def handle_rotate_key(args):
-    payload = json.loads(args.payload)
+    from mcp_server.identity_manager import IdentityManager
+    payload = json_loads(args.payload)
     did = payload.get("did")
     passphrase = payload.get("passphrase", "default-passphrase") # In real app, prompt user
     
@@ -141,45 +263,91 @@ def handle_rotate_key(args):
         return {"success": False, "error": str(e)}
 
 def handle_query_ledger(args):
-    db_path = Path(__file__).parent / "ledger" / "qorelogic_soa_ledger.db"
+    db_path = _LEDGER_DB
     if not db_path.exists():
         return {"success": False, "error": "Ledger DB not found"}
         
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM soa_ledger ORDER BY timestamp DESC LIMIT 50")
-        rows = [dict(r) for r in cur.fetchall()]
-        conn.close()
+        with _get_ledger_conn(db_path) as conn:
+            # Implicit cursor from conn.execute; plain tuples + one zip
+            # per row avoid materializing sqlite3.Row objects.
+            cur = conn.execute(LEDGER_QUERY)
+            cur.row_factory = None
+            rows = [dict(zip(LEDGER_COLS, row)) for row in cur]
         return {"success": True, "events": rows}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("action", help="Action to perform")
-    parser.add_argument("--payload", help="JSON payload", default="{}")
-    args = parser.parse_args()
-    
-    actions = {
-        "get_verification_config": handle_get_verification_config,
-        "set_verification_config": handle_set_verification_config,
-        "get_trust_status": handle_get_trust_status,
-        "list_identities": handle_list_identities,
-        "rotate_key": handle_rotate_key,
-        "query_ledger": handle_query_ledger
-    }
-    
-    if args.action in actions:
+ACTIONS = {
+    "get_verification_config": handle_get_verification_config,
+    "set_verification_config": handle_set_verification_config,
+    "get_trust_status": handle_get_trust_status,
+    "list_identities": handle_list_identities,
+    "rotate_key": handle_rotate_key,
+    "query_ledger": handle_query_ledger
+}
+
+def dispatch(action, payload="{}"):
+    """Run one bridge action and return its result dict."""
+    handler = ACTIONS.get(action)
+    if handler is None:
+        return {"success": False, "error": "Unknown action"}
+    try:
+        return handler(SimpleNamespace(action=action, payload=payload))
+    except Exception as e:
+        # traceback.print_exc()
+        return {"success": False, "error": str(e)}
+
+def serve():
+    """
+    Daemon mode: one JSON request per stdin line, one JSON response per
+    stdout line. Keeps the ledger pool and config caches warm instead of
+    paying interpreter + import startup for every launcher command.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
         try:
-            result = actions[args.action](args)
-            print(json.dumps(result))
+            req = json_loads(line)
+            result = dispatch(req.get("action", ""), req.get("payload", "{}"))
         except Exception as e:
-            # traceback.print_exc()
-            print(json.dumps({"success": False, "error": str(e)}))
-    else:
-        print(json.dumps({"success": False, "error": "Unknown action"}))
+            result = {"success": False, "error": str(e)}
+        sys.stdout.write(json_dumps(result) + "\n")
+        sys.stdout.flush()
+
+def main():
+    # The grammar is tiny (action, --payload, --serve), so hand-parse
+    # sys.argv instead of paying argparse's setup cost per invocation.
+    action = ""
+    payload = "{}"
+    serve_mode = False
+
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--serve":
+            serve_mode = True
+        elif arg == "--payload":
+            i += 1
+            if i < len(argv):
+                payload = argv[i]
+        elif arg.startswith("--payload="):
+            payload = arg[len("--payload="):]
+        elif not action:
+            action = arg
+        i += 1
+
+    if serve_mode:
+        serve()
+        return
+
+    if not action:
+        print("usage: bridge.py <action> [--payload JSON] | --serve", file=sys.stderr)
+        sys.exit(2)
+
+    print(json_dumps(dispatch(action, payload)))
 
 if __name__ == "__main__":
     main()
@@ -10,14 +10,26 @@ This bridges the Dashboard's agent configuration UI to the runtime.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
+import functools
+import threading
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-# Configuration paths (in order of priority)
-CONFIG_PATHS = [
+# Optional fast JSON parser; stdlib json is the fallback
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    _json_loads = json.loads
+
+# Configuration paths (in order of priority); empty entries (e.g. unset
+# env override) are dropped once at import so load() never re-tests them.
+CONFIG_PATHS = tuple(p for p in [
     # 1. Dashboard-saved config (via /api/agents/config -> ledger volume)
     "/app/ledger/config/agents.json",
     # 2. Docker container mount point (legacy)
@@ -26,7 +38,7 @@ CONFIG_PATHS = [
     os.path.expanduser("~/.qorelogic/config/agents.json"),
     # 4. Environment variable override
     os.environ.get("QORELOGIC_AGENTS_CONFIG", ""),
-]
+] if p)
 
 @dataclass
 class AgentConfig:
@@ -95,40 +107,48 @@ class AgentConfigLoader:
     Configuration is loaded once at startup and can be refreshed via reload().
     """
     
-    _instance: Optional['AgentConfigLoader'] = None
     _config: Optional[AgentConfig] = None
     _config_path: Optional[str] = None
-    _last_mtime: float = 0
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
+    # (st_mtime_ns, st_size, st_ino) of the loaded file; survives atomic
+    # os.replace() writes that an mtime-only check can miss.
+    _last_sig: Optional[Tuple[int, int, int]] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _stat_sig(path: str) -> Optional[Tuple[int, int, int]]:
+        """Single-stat change signature for a config file, or None if missing."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
     def load(self, force_reload: bool = False) -> AgentConfig:
         """
         Load configuration from the first available config path.
-        
+
         Args:
             force_reload: If True, bypass cache and reload from disk.
-            
+
         Returns:
             AgentConfig with loaded or default values.
         """
         if self._config and not force_reload:
-            # Check if file has been modified
-            if self._config_path and os.path.exists(self._config_path):
-                current_mtime = os.path.getmtime(self._config_path)
-                if current_mtime <= self._last_mtime:
+            # One stat call: unchanged signature means cache hit
+            if self._config_path:
+                if self._stat_sig(self._config_path) == self._last_sig:
                     return self._config
-        
-        # Try each config path
-        for path in CONFIG_PATHS:
-            if path and os.path.exists(path):
+
+        with self._lock:
+            # Try each config path
+            for path in CONFIG_PATHS:
+                sig = self._stat_sig(path)
+                if sig is None:
+                    continue
                 try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
+                    with open(path, 'rb') as f:
+                        data = _json_loads(f.read())
+
                     self._config = AgentConfig(
                         provider=data.get("provider", "ollama"),
                         endpoint=data.get("endpoint", "http://localhost:11434/api/generate"),
@@ -137,19 +157,19 @@ class AgentConfigLoader:
                         agents=data.get("agents", {})
                     )
                     self._config_path = path
-                    self._last_mtime = os.path.getmtime(path)
-                    
+                    self._last_sig = sig
+
                     logger.info(f"Loaded agent config from {path}")
                     return self._config
-                    
-                except (json.JSONDecodeError, IOError) as e:
+
+                except (ValueError, IOError) as e:
                     logger.warning(f"Failed to load config from {path}: {e}")
                     continue
-        
-        # No config found, use defaults
-        logger.info("No agents.json found, using default configuration")
-        self._config = AgentConfig()
-        return self._config
+
+            # No config found, use defaults
+            logger.info("No agents.json found, using default configuration")
+            self._config = AgentConfig()
+            return self._config
     
     def reload(self) -> AgentConfig:
         """Force reload configuration from disk."""
@@ -162,12 +182,18 @@ class AgentConfigLoader:
         return self._config
 
 
-# Singleton accessor
+# Singleton accessor: functools.cache resolves to a C-level dict lookup,
+# cheaper than a __new__ override and safe against subclass sharing.
+@functools.cache
+def _get_loader() -> AgentConfigLoader:
+    return AgentConfigLoader()
+
+
 def get_agent_config() -> AgentConfig:
     """Get the current agent configuration."""
-    return AgentConfigLoader().get_config()
+    return _get_loader().get_config()
 
 
 def reload_agent_config() -> AgentConfig:
     """Force reload agent configuration from disk."""
-    return AgentConfigLoader().reload()
+    return _get_loader().reload()
@@ -12,13 +12,34 @@ Research Reference: FORMAL_METHODS.md §6
 - Lite mode heuristics catch 60-70% of common patterns
 """
 
+import hashlib
 import logging
+from collections import OrderedDict
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Optional BLAKE3 for content-hash cache keys; blake2b otherwise
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+def _content_key(data: bytes) -> bytes:
+    if blake3 is not None:
+        return blake3.blake3(data).digest(length=16)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+# Sentinel distinguishing "not loaded yet" from "import failed": once a
+# dependency probe fails, the property caches None and never re-probes.
+_UNSET = object()
+
+# Severities that surface as violations (O(1) membership vs per-call list)
+_CRIT_SEVERITIES = frozenset({"HIGH", "CRITICAL"})
+
 
 class CBMCStatus(Enum):
     """Verification result status."""
@@ -29,6 +50,10 @@ class CBMCStatus(Enum):
     DISABLED = "DISABLED"      # User disabled verification
     LITE_ONLY = "LITE_ONLY"    # Only heuristic checks ran
 
+# Direct value->member mapping; avoids the enum constructor's linear
+# member search on every verify call
+_STATUS_MAP = {s.value: s for s in CBMCStatus}
+
 
 @dataclass
 class BMCResult:
@@ -40,15 +65,29 @@ class BMCResult:
     heuristic_findings: List[Dict] = None
     transpilation_used: bool = False
     model_used: str = ""
-    
+    # Bare violation identifiers (pattern ids / CBMC violation types) for
+    # O(1) membership tests; the violations strings stay human-readable
+    violation_codes: frozenset = None
+
     def __post_init__(self):
         if self.heuristic_findings is None:
             self.heuristic_findings = []
-    
+        if self.violation_codes is None:
+            # Each violation reads "[Lnn] CODE: description" or
+            # "CODE: description"; lift out the CODE token once here so
+            # callers never scan the string list
+            codes = set()
+            for v in self.violations:
+                head, sep, _rest = v.partition(":")
+                if sep:
+                    codes.add(head.split("] ", 1)[-1].strip())
+            self.violation_codes = frozenset(codes)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "status": self.status.value,
             "violations": self.violations,
+            "violation_codes": sorted(self.violation_codes),
             "mode": self.mode,
             "heuristic_findings": self.heuristic_findings,
             "transpilation_used": self.transpilation_used,
@@ -66,15 +105,19 @@ class CBMCVerifier:
     3. Content type (Python vs C)
     """
     
+    # Bound on memoized heuristic scans (LRU eviction)
+    _HEURISTIC_CACHE_SIZE = 256
+
     def __init__(self):
-        self._config = None
-        self._heuristic_scanner = None
-        self._transpiler = None
-        self._cbmc_wrapper = None
-    
+        self._config = _UNSET
+        self._heuristic_scanner = _UNSET
+        self._transpiler = _UNSET
+        self._cbmc_wrapper = _UNSET
+        self._heuristic_cache: OrderedDict = OrderedDict()
+
     @property
     def config(self):
-        if self._config is None:
+        if self._config is _UNSET:
             try:
                 from .verification_config import get_verification_config
                 self._config = get_verification_config()
@@ -83,30 +126,30 @@ class CBMCVerifier:
                 from .verification_config import VerificationConfig
                 self._config = VerificationConfig()
         return self._config
-    
+
     @property
     def heuristic_scanner(self):
-        if self._heuristic_scanner is None:
+        if self._heuristic_scanner is _UNSET:
             try:
                 from .heuristic_patterns import get_heuristic_scanner
                 self._heuristic_scanner = get_heuristic_scanner()
             except ImportError:
                 self._heuristic_scanner = None
         return self._heuristic_scanner
-    
+
     @property
     def transpiler(self):
-        if self._transpiler is None:
+        if self._transpiler is _UNSET:
             try:
                 from .pyveritas_transpiler import get_transpiler
                 self._transpiler = get_transpiler()
             except ImportError:
                 self._transpiler = None
         return self._transpiler
-    
+
     @property
     def cbmc_wrapper(self):
-        if self._cbmc_wrapper is None:
+        if self._cbmc_wrapper is _UNSET:
             try:
                 from .cbmc_wrapper import get_cbmc_wrapper
                 self._cbmc_wrapper = get_cbmc_wrapper(
@@ -161,7 +204,7 @@ class CBMCVerifier:
         result = self.cbmc_wrapper.verify_c_code(content)
         
         return BMCResult(
-            status=CBMCStatus(result.status.value),
+            status=_STATUS_MAP[result.status.name],
             violations=[v.description for v in result.violations],
             output=result.output,
             mode="full",
@@ -172,7 +215,13 @@ class CBMCVerifier:
         """Full Mode: Transpile Python to C, then verify with CBMC."""
         # Always run heuristics first
         heuristic_findings = self._run_heuristics(content)
-        
+
+        # Shared by the three fallback branches below; built once
+        crit_violations = [
+            f'{f["id"]}: {f["description"]}'
+            for f in heuristic_findings if f["severity"] in _CRIT_SEVERITIES
+        ]
+
         # Check if transpiler available
         if self.transpiler is None:
             logger.warning("PyVeritas transpiler not available, falling back to Lite mode")
@@ -184,7 +233,7 @@ class CBMCVerifier:
             logger.warning(f"LLM not available ({msg}), falling back to Lite mode")
             return BMCResult(
                 status=CBMCStatus.LITE_ONLY,
-                violations=[f["id"] + ": " + f["description"] for f in heuristic_findings if f["severity"] in ["HIGH", "CRITICAL"]],
+                violations=crit_violations,
                 output=f"LLM unavailable ({msg}). Heuristic analysis only.",
                 mode="lite",
                 heuristic_findings=heuristic_findings
@@ -198,7 +247,7 @@ class CBMCVerifier:
             logger.warning(f"Transpilation failed: {trans_result.error_message}")
             return BMCResult(
                 status=CBMCStatus.LITE_ONLY,
-                violations=[f["id"] + ": " + f["description"] for f in heuristic_findings if f["severity"] in ["HIGH", "CRITICAL"]],
+                violations=crit_violations,
                 output=f"Transpilation failed: {trans_result.error_message}. Heuristic analysis only.",
                 mode="lite",
                 heuristic_findings=heuristic_findings,
@@ -210,7 +259,7 @@ class CBMCVerifier:
         if self.cbmc_wrapper is None or not self.cbmc_wrapper.is_available:
             return BMCResult(
                 status=CBMCStatus.LITE_ONLY,
-                violations=[f["id"] + ": " + f["description"] for f in heuristic_findings if f["severity"] in ["HIGH", "CRITICAL"]],
+                violations=crit_violations,
                 output="CBMC unavailable. Heuristic analysis only.",
                 mode="lite",
                 heuristic_findings=heuristic_findings,
@@ -220,29 +269,28 @@ class CBMCVerifier:
         
         cbmc_result = self.cbmc_wrapper.verify_c_code(trans_result.c_code)
         
-        # Merge heuristic and CBMC findings
-        all_violations = []
-        
-        # Add CBMC violations with Python line mapping
-        for v in cbmc_result.violations:
-            py_line = trans_result.python_line_map.get(v.line)
-            if py_line:
-                all_violations.append(f"[L{py_line}] {v.type}: {v.description}")
-            else:
-                all_violations.append(f"{v.type}: {v.description}")
-        
-        # Add critical heuristic findings
+        # Merge heuristic and CBMC findings in one pass each; bind the
+        # line map to a local so the loop avoids repeated attribute access
+        lmap = trans_result.python_line_map
+        all_violations = [
+            f"[L{lmap[v.line]}] {v.type}: {v.description}" if v.line in lmap
+            else f"{v.type}: {v.description}"
+            for v in cbmc_result.violations
+        ]
+        has_critical = False
         for f in heuristic_findings:
-            if f["severity"] in ["HIGH", "CRITICAL"]:
+            severity = f["severity"]
+            if severity in _CRIT_SEVERITIES:
                 all_violations.append(f"[L{f['line']}] {f['id']}: {f['description']}")
-        
-        # Determine final status
-        if cbmc_result.status.value == "FAIL" or any(f["severity"] == "CRITICAL" for f in heuristic_findings):
+            has_critical |= severity == "CRITICAL"
+
+        # Determine final status (has_critical computed in the pass above)
+        if cbmc_result.status.name == "FAIL" or has_critical:
             status = CBMCStatus.FAIL
-        elif cbmc_result.status.value == "PASS":
+        elif cbmc_result.status.name == "PASS":
             status = CBMCStatus.PASS
         else:
-            status = CBMCStatus(cbmc_result.status.value)
+            status = _STATUS_MAP[cbmc_result.status.name]
         
         return BMCResult(
             status=status,
@@ -277,12 +325,50 @@ class CBMCVerifier:
             heuristic_findings=findings
         )
     
+    def verify_batch(self, contents: List[tuple]) -> List[BMCResult]:
+        """
+        Verify several independent artifacts in parallel.
+
+        Args:
+            contents: List of (content, is_c_code) tuples
+
+        Returns:
+            BMCResults in the same order as the inputs
+        """
+        if len(contents) <= 1:
+            return [self.verify(content, is_c) for content, is_c in contents]
+
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(len(contents), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_verify_one, contents))
+
     def _run_heuristics(self, content: str) -> List[Dict]:
-        """Run heuristic pattern scanner."""
+        """Run heuristic pattern scanner (memoized by content hash)."""
         if self.heuristic_scanner is None:
             return []
-        
-        return self.heuristic_scanner.scan(content, severity_threshold="LOW")
+
+        # Iterative Sentinel review re-verifies identical artifacts;
+        # hashing (multi-GB/s) is far cheaper than the regex scan.
+        key = _content_key(content.encode())
+        cached = self._heuristic_cache.get(key)
+        if cached is not None:
+            self._heuristic_cache.move_to_end(key)
+            return cached
+
+        findings = self.heuristic_scanner.scan(content, severity_threshold="LOW")
+        self._heuristic_cache[key] = findings
+        if len(self._heuristic_cache) > self._HEURISTIC_CACHE_SIZE:
+            self._heuristic_cache.popitem(last=False)
+        return findings
+
+
+def _verify_one(item: tuple) -> BMCResult:
+    """Pool worker entry point: each process reuses its own singleton."""
+    content, is_c_code = item
+    return get_cbmc_verifier().verify(content, is_c_code)
 
 
 # Singleton accessor
@@ -8,40 +8,97 @@ direct C code verification.
 Research Reference: FORMAL_METHODS.md §3.3
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
 import shutil
 import subprocess
 import tempfile
+import re
 import signal
+import sys
 import logging
+from collections import OrderedDict
 from typing import List, Optional, Tuple, Dict
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 
 logger = logging.getLogger(__name__)
 
+# Optional BLAKE3 for the result-cache content key
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
-class CBMCStatus(Enum):
-    """CBMC execution result status."""
-    PASS = "PASS"              # No violations found
-    FAIL = "FAIL"              # Violations detected
-    TIMEOUT = "TIMEOUT"        # Exceeded time limit
-    MEMORY_EXCEEDED = "MEMORY_EXCEEDED"  # Exceeded memory limit
-    PARSE_ERROR = "PARSE_ERROR"  # Could not parse C code
-    UNAVAILABLE = "UNAVAILABLE"  # CBMC not installed
-    ERROR = "ERROR"            # Other error
+# Optional streaming JSON parser: keeps violation parsing at
+# O(violations) memory instead of materializing the full output tree
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
+# Optional fast serializer for result payloads (stdlib json fallback)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _json_default(obj):
+    """orjson fallback encoder for the enum field."""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+# Property classes checked by CBMC. The async path runs one solver
+# process per class: smaller formulas solve faster than one combined
+# formula, and the first FAIL short-circuits the rest.
+CHECK_FLAGS = (
+    "--bounds-check",
+    "--pointer-check",
+    "--div-by-zero-check",
+    "--signed-overflow-check",
+    "--unsigned-overflow-check",
+)
+
+
+class CBMCStatus(IntEnum):
+    """
+    CBMC execution result status.
+
+    Integer-valued so batch serialization emits small ints rather than
+    allocating a status string per result; use STATUS_NAMES (or .name)
+    for human-readable output.
+    """
+    PASS = 0               # No violations found
+    FAIL = 1               # Violations detected
+    TIMEOUT = 2            # Exceeded time limit
+    MEMORY_EXCEEDED = 3    # Exceeded memory limit
+    PARSE_ERROR = 4        # Could not parse C code
+    UNAVAILABLE = 5        # CBMC not installed
+    ERROR = 6              # Other error
+
+
+STATUS_NAMES = {s: s.name for s in CBMCStatus}
+
+# Failure lines in plain-text CBMC output; a single finditer over the
+# raw bytes replaces a Python-level loop over split lines
+_FAIL_RE = re.compile(rb"^.*\b(?:FAILURE|VIOLATED)\b.*$", re.MULTILINE)
+
+
+@dataclass(slots=True, frozen=True)
 class CBMCViolation:
-    """A single CBMC violation."""
+    """A single CBMC violation (slotted: large FAIL runs make thousands)."""
     type: str           # e.g., "division by zero", "array bounds"
     file: str
     line: int
     function: str
     description: str
-    trace: List[str] = None
-    
+    trace: Tuple[str, ...] = ()
+
     def to_dict(self) -> Dict:
         return {
             "type": self.type,
@@ -49,11 +106,11 @@ class CBMCViolation:
             "line": self.line,
             "function": self.function,
             "description": self.description,
-            "trace": self.trace or []
+            "trace": list(self.trace or ())
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CBMCResult:
     """Complete CBMC execution result."""
     status: CBMCStatus
@@ -72,18 +129,60 @@ class CBMCResult:
             "unwind_depth": self.unwind_depth
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize directly to JSON bytes. With orjson installed the
+        dataclasses are walked in C, skipping the per-violation dict
+        construction that to_dict pays.
+        """
+        if orjson is not None:
+            return orjson.dumps(self, default=_json_default)
+        return json.dumps(self.to_dict()).encode()
+
+
+# On-disk result cache so CI reruns and fresh processes hit too
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "qorelogic", "cbmc")
+
+# Scratch dir for the C snippets handed to CBMC: tmpfs when the platform
+# has it (no disk I/O for the write/read round-trip), else the default.
+_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+@functools.cache
+def _cbmc_probe() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Locate the CBMC binary and read its version, once per process.
+
+    The PATH lookup plus `cbmc --version` fork+exec would otherwise be
+    repeated by every wrapper construction and availability check.
+    Call _cbmc_probe.cache_clear() in tests to force a re-probe.
+    """
+    cbmc_path = shutil.which("cbmc")
+    if not cbmc_path:
+        return None, None
+    try:
+        result = subprocess.run([cbmc_path, "--version"], capture_output=True, text=True)
+        version = result.stdout.strip().split('\n')[0]
+    except Exception:
+        version = None
+    return cbmc_path, version
+
 
 class CBMCWrapper:
     """
     Safe CBMC execution wrapper.
-    
+
     Features:
     - Timeout protection
     - Memory limits (via ulimit on Linux, advisory on Windows)
     - Structured result parsing
     - Temporary file management
+    - Result caching keyed by content hash (memory + disk)
     """
-    
+
+    # Bound on in-memory cached results (LRU eviction)
+    _RESULT_CACHE_SIZE = 1024
+
     def __init__(
         self,
         timeout_seconds: int = 30,
@@ -93,7 +192,63 @@ class CBMCWrapper:
         self.timeout_seconds = timeout_seconds
         self.memory_limit_mb = memory_limit_mb
         self.unwind_depth = unwind_depth
-        self.cbmc_path = shutil.which("cbmc")
+        self.cbmc_path, _ = _cbmc_probe()
+        self._result_cache: OrderedDict = OrderedDict()
+        # Invocation prefix built once; per-call work is just file + flags
+        self._base_flags = ("--unwind", str(self.unwind_depth), "--json-ui")
+
+    def _cache_key(self, c_code: str, function: Optional[str]) -> str:
+        """Content hash + flags fingerprint; limits changes invalidate."""
+        if blake3 is not None:
+            digest = blake3.blake3(c_code.encode()).hexdigest(length=16)
+        else:
+            digest = hashlib.blake2b(c_code.encode(), digest_size=16).hexdigest()
+        return f"{digest}-{function or 'main'}-u{self.unwind_depth}-m{self.memory_limit_mb}"
+
+    def _cache_get(self, key: str) -> Optional[CBMCResult]:
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return cached
+
+        # Disk fallback (survives process restarts / CI reruns)
+        try:
+            with open(os.path.join(_CACHE_DIR, key + ".json"), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            result = CBMCResult(
+                status=CBMCStatus[data["status"]],
+                violations=[CBMCViolation(**v) for v in data["violations"]],
+                output=data["output"],
+                stderr=data.get("stderr", ""),
+                elapsed_seconds=data.get("elapsed_seconds", 0.0),
+                unwind_depth=data.get("unwind_depth", self.unwind_depth)
+            )
+            self._result_cache[key] = result
+            return result
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def _cache_put(self, key: str, result: CBMCResult) -> None:
+        # Only deterministic outcomes are worth replaying
+        if result.status not in (CBMCStatus.PASS, CBMCStatus.FAIL):
+            return
+        self._result_cache[key] = result
+        if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            data = {
+                "status": result.status.name,
+                "violations": [v.to_dict() for v in result.violations],
+                "output": result.output,
+                "stderr": result.stderr,
+                "elapsed_seconds": result.elapsed_seconds,
+                "unwind_depth": result.unwind_depth
+            }
+            with open(os.path.join(_CACHE_DIR, key + ".json"), "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError:
+            pass
         
     @property
     def is_available(self) -> bool:
@@ -117,19 +272,27 @@ class CBMCWrapper:
                 violations=[],
                 output="CBMC binary not found in PATH"
             )
-        
+
+        key = self._cache_key(c_code, function)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         # Write to temp file
         with tempfile.NamedTemporaryFile(
-            mode='w', 
-            suffix='.c', 
+            mode='w',
+            suffix='.c',
+            dir=_TMP_DIR,
             delete=False,
             encoding='utf-8'
         ) as tmp:
             tmp.write(c_code)
             tmp_path = tmp.name
-        
+
         try:
-            return self._run_cbmc(tmp_path, function)
+            result = self._run_cbmc(tmp_path, function)
+            self._cache_put(key, result)
+            return result
         finally:
             # Cleanup
             if os.path.exists(tmp_path):
@@ -153,40 +316,79 @@ class CBMCWrapper:
         
         return self._run_cbmc(file_path, function)
     
+    def _limit_resources(self):
+        """
+        preexec_fn for the CBMC child: kernel-enforced address-space and
+        CPU caps, so a pathological verification gets a clean kill instead
+        of OOMing the host (memory_limit_mb was previously advisory only).
+        """
+        import resource
+        limit = self.memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        cpu = self.timeout_seconds + 5
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+
+    @property
+    def _preexec_fn(self):
+        """Resource-limit hook on POSIX; unsupported (advisory) elsewhere."""
+        return self._limit_resources if os.name == "posix" else None
+
+    # SIGKILL exit codes reported for a child killed by the rlimit caps
+    _KILLED_RETURNCODES = frozenset({-9, 137})
+
+    @staticmethod
+    def _kill_group(pid: int) -> None:
+        """SIGKILL the child's whole process group (grandchildren included)."""
+        try:
+            os.killpg(os.getpgid(pid), signal.SIGKILL)
+        except (OSError, AttributeError):
+            # Group already gone, or platform without killpg
+            pass
+
     def _run_cbmc(self, file_path: str, function: str = None) -> CBMCResult:
         """Execute CBMC with safety limits."""
         import time
         start_time = time.time()
-        
-        # Build command
-        cmd = [
-            self.cbmc_path,
-            file_path,
-            f"--unwind", str(self.unwind_depth),
-            "--bounds-check",
-            "--pointer-check",
-            "--div-by-zero-check",
-            "--signed-overflow-check",
-            "--unsigned-overflow-check",
-            "--json-ui"  # Structured output
-        ]
-        
+
+        # Build command from the precomputed prefix
+        cmd = [self.cbmc_path, file_path, *self._base_flags, *CHECK_FLAGS]
+
         if function:
             cmd.extend(["--function", function])
-        
+
         try:
-            # Run with timeout
-            result = subprocess.run(
+            # Own session so a timeout kill reaps the whole process group:
+            # CBMC can spawn solver children that outlive the parent when
+            # only the parent is killed.
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=self.timeout_seconds
+                start_new_session=True,
+                preexec_fn=self._preexec_fn
             )
-            
+            try:
+                stdout, stderr = proc.communicate(timeout=self.timeout_seconds)
+            except subprocess.TimeoutExpired:
+                self._kill_group(proc.pid)
+                proc.communicate()
+                raise
+            result = subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
             elapsed = time.time() - start_time
-            
+
             # Parse result
-            if result.returncode == 0:
+            if result.returncode in self._KILLED_RETURNCODES:
+                return CBMCResult(
+                    status=CBMCStatus.MEMORY_EXCEEDED,
+                    violations=[],
+                    output=f"CBMC killed by {self.memory_limit_mb}MB memory limit",
+                    stderr=result.stderr,
+                    elapsed_seconds=elapsed,
+                    unwind_depth=self.unwind_depth
+                )
+            elif result.returncode == 0:
                 return CBMCResult(
                     status=CBMCStatus.PASS,
                     violations=[],
@@ -236,40 +438,274 @@ class CBMCWrapper:
                 unwind_depth=self.unwind_depth
             )
     
+    async def verify_c_code_async(self, c_code: str, function: str = None) -> CBMCResult:
+        """Async variant of verify_c_code for concurrent batch verification."""
+        if not self.is_available:
+            return CBMCResult(
+                status=CBMCStatus.UNAVAILABLE,
+                violations=[],
+                output="CBMC binary not found in PATH"
+            )
+
+        key = self._cache_key(c_code, function)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            suffix='.c',
+            dir=_TMP_DIR,
+            delete=False,
+            encoding='utf-8'
+        ) as tmp:
+            tmp.write(c_code)
+            tmp_path = tmp.name
+
+        try:
+            result = await self._run_cbmc_async(tmp_path, function)
+            self._cache_put(key, result)
+            return result
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def verify_batch(self, snippets: List[Tuple[str, str]]) -> List[CBMCResult]:
+        """
+        Verify several symbol-disjoint C snippets in one CBMC run.
+
+        Concatenates the snippets into a single translation unit plus a
+        generated main_all driver that nondeterministically dispatches to
+        one entry point, so CBMC explores every sub-problem while the
+        goto-cc parse and symex startup are paid once instead of K times.
+
+        Args:
+            snippets: List of (c_code, entry_function) tuples. Every
+                snippet needs a named entry function; callers must ensure
+                the snippets share no symbols.
+
+        Returns:
+            CBMCResults in input order.
+        """
+        if not snippets:
+            return []
+        # Single item, or no entry name to dispatch on: batching buys
+        # nothing / is ambiguous — verify individually.
+        if len(snippets) == 1 or any(not fn for _, fn in snippets):
+            return [self.verify_c_code(code, fn) for code, fn in snippets]
+
+        parts = ["unsigned int nondet_uint();\n"]
+        ranges = []
+        next_line = 2
+        for code, _fn in snippets:
+            chunk = code if code.endswith("\n") else code + "\n"
+            parts.append(chunk)
+            ranges.append((next_line, next_line + chunk.count("\n") - 1))
+            next_line += chunk.count("\n")
+
+        parts.append("void main_all(void) {\n")
+        parts.append(f"    switch (nondet_uint() % {len(snippets)}u) {{\n")
+        for i, (_code, fn) in enumerate(snippets):
+            parts.append(f"        case {i}u: {fn}(); break;\n")
+        parts.append("    }\n}\n")
+
+        batch_result = self.verify_c_code("".join(parts), function="main_all")
+
+        # Non-verdict outcomes (timeout, parse error, ...) apply to the
+        # batch as a whole
+        if batch_result.status not in (CBMCStatus.PASS, CBMCStatus.FAIL):
+            return [batch_result] * len(snippets)
+
+        # Route violations back to their origin snippet by line range,
+        # rebasing line numbers onto the snippet's own numbering
+        per_snippet: List[List[CBMCViolation]] = [[] for _ in snippets]
+        mapped_any = False
+        for v in batch_result.violations:
+            try:
+                line = int(v.line)
+            except (TypeError, ValueError):
+                line = 0
+            for i, (start, end) in enumerate(ranges):
+                if start <= line <= end:
+                    per_snippet[i].append(CBMCViolation(
+                        type=v.type,
+                        file=v.file,
+                        line=line - start + 1,
+                        function=v.function,
+                        description=v.description,
+                        trace=v.trace
+                    ))
+                    mapped_any = True
+                    break
+
+        if batch_result.status == CBMCStatus.FAIL and not mapped_any:
+            # Violations without usable source locations can't be
+            # attributed; re-verify individually rather than guess
+            return [self.verify_c_code(code, fn) for code, fn in snippets]
+
+        return [
+            CBMCResult(
+                status=CBMCStatus.FAIL if found else CBMCStatus.PASS,
+                violations=found,
+                output=batch_result.output,
+                stderr=batch_result.stderr,
+                elapsed_seconds=batch_result.elapsed_seconds,
+                unwind_depth=self.unwind_depth
+            )
+            for found in per_snippet
+        ]
+
+    async def verify_many(self, items: List[Tuple[str, Optional[str]]]) -> List[CBMCResult]:
+        """
+        Verify several independent C snippets concurrently.
+
+        Args:
+            items: List of (c_code, function) tuples
+
+        Returns:
+            CBMCResults in input order; scheduling is bounded by core count
+            so CBMC processes don't oversubscribe the machine.
+        """
+        sem = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def bounded(code, function):
+            async with sem:
+                return await self.verify_c_code_async(code, function)
+
+        results = await asyncio.gather(
+            *(bounded(code, function) for code, function in items),
+            return_exceptions=True
+        )
+        return [
+            r if isinstance(r, CBMCResult) else CBMCResult(
+                status=CBMCStatus.ERROR, violations=[], output=str(r)
+            )
+            for r in results
+        ]
+
+    async def _exec_cbmc(self, cmd: List[str]) -> Tuple[int, str, str]:
+        """Run one CBMC command, killing the process on timeout."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+            preexec_fn=self._preexec_fn
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self._kill_group(proc.pid)
+            await proc.communicate()
+            raise
+        return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+    async def _run_cbmc_async(self, file_path: str, function: str = None) -> CBMCResult:
+        """
+        Async twin of _run_cbmc: one solver process per property class,
+        run concurrently, stopping at the first FAIL.
+        """
+        import time
+        start_time = time.time()
+
+        base = [self.cbmc_path, file_path, *self._base_flags]
+        if function:
+            base.extend(["--function", function])
+
+        tasks = [
+            asyncio.ensure_future(self._exec_cbmc(base + [flag]))
+            for flag in CHECK_FLAGS
+        ]
+
+        status = CBMCStatus.PASS
+        violations: List[CBMCViolation] = []
+        output = ""
+        stderr = ""
+        try:
+            for future in asyncio.as_completed(tasks):
+                returncode, out, err = await future
+                if returncode == 10:
+                    # First violated property class wins; skip the rest
+                    status = CBMCStatus.FAIL
+                    violations = self._parse_violations(out)
+                    output, stderr = out, err
+                    break
+                elif returncode in self._KILLED_RETURNCODES:
+                    status = CBMCStatus.MEMORY_EXCEEDED
+                    output = f"CBMC killed by {self.memory_limit_mb}MB memory limit"
+                    stderr = err
+                    break
+                elif returncode != 0:
+                    status = CBMCStatus.PARSE_ERROR
+                    output, stderr = out, err
+                    break
+                elif not output:
+                    output, stderr = out, err
+        except asyncio.TimeoutError:
+            status = CBMCStatus.TIMEOUT
+            output = f"CBMC exceeded {self.timeout_seconds}s timeout"
+        except Exception as e:
+            status = CBMCStatus.ERROR
+            output = str(e)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return CBMCResult(
+            status=status,
+            violations=violations,
+            output=output,
+            stderr=stderr,
+            elapsed_seconds=time.time() - start_time,
+            unwind_depth=self.unwind_depth
+        )
+
     def _parse_violations(self, output: str) -> List[CBMCViolation]:
         """Parse CBMC output for violations."""
         violations = []
-        
-        # Try JSON parsing first
-        import json
+
+        # Try JSON parsing first; stream with ijson when available so only
+        # ERROR records are materialized, not the whole output tree
         try:
-            data = json.loads(output)
-            for item in data:
+            if ijson is not None:
+                import io
+                items = ijson.items(io.BytesIO(output.encode()), "item")
+            else:
+                items = json.loads(output)
+            for item in items:
                 if item.get("messageType") == "ERROR":
+                    loc = item.get("sourceLocation", {})
+                    # Property/function names repeat across thousands of
+                    # violations; interning deduplicates the storage
                     violations.append(CBMCViolation(
-                        type=item.get("property", "unknown"),
-                        file=item.get("sourceLocation", {}).get("file", ""),
-                        line=item.get("sourceLocation", {}).get("line", 0),
-                        function=item.get("sourceLocation", {}).get("function", ""),
+                        type=sys.intern(item.get("property", "unknown")),
+                        file=loc.get("file", ""),
+                        line=loc.get("line", 0),
+                        function=sys.intern(loc.get("function", "")),
                         description=item.get("messageText", ""),
-                        trace=[]
+                        trace=()
                     ))
             return violations
-        except json.JSONDecodeError:
-            pass
-        
-        # Fallback to text parsing
-        for line in output.splitlines():
-            if "FAILURE" in line or "VIOLATED" in line:
-                violations.append(CBMCViolation(
-                    type="unknown",
-                    file="",
-                    line=0,
-                    function="",
-                    description=line.strip(),
-                    trace=[]
-                ))
+        except Exception:
+            # Not JSON (e.g. plain-text CBMC output); fall through
+            violations = []
         
+        # Fallback to text parsing: one regex pass over the raw bytes
+        # instead of splitting multi-MB output into a list of lines
+        for m in _FAIL_RE.finditer(output.encode()):
+            violations.append(CBMCViolation(
+                type="unknown",
+                file="",
+                line=0,
+                function="",
+                description=m.group(0).decode(errors="replace").strip(),
+                trace=()
+            ))
+
         return violations
 
 
@@ -290,13 +726,9 @@ def get_cbmc_wrapper(
 
 def check_cbmc_available() -> Tuple[bool, str]:
     """Check if CBMC is available and return version."""
-    cbmc_path = shutil.which("cbmc")
+    cbmc_path, version = _cbmc_probe()
     if not cbmc_path:
         return False, "CBMC not found in PATH"
-    
-    try:
-        result = subprocess.run([cbmc_path, "--version"], capture_output=True, text=True)
-        version = result.stdout.strip().split('\n')[0]
-        return True, version
-    except Exception as e:
-        return False, str(e)
+    if version is None:
+        return False, f"Failed to run {cbmc_path} --version"
+    return True, version
@@ -5,7 +5,9 @@ Provides interface to Z3 Theorem Prover for verifying
 Design-by-Contract constraints extracted from code.
 """
 import logging
-from typing import Dict, Tuple, Any
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 try:
     import z3
@@ -13,10 +15,80 @@ try:
 except ImportError:
     Z3_AVAILABLE = False
 
+try:
+    import deal
+    DEAL_AVAILABLE = True
+except ImportError:
+    DEAL_AVAILABLE = False
+
+# Runtime contract checking is deliberately NOT activated at import:
+# deal's wrappers tax every decorated call process-wide, so production
+# deployments can opt out (QORELOGIC_DISABLE_CONTRACTS=1) and CI/tests
+# opt in explicitly via enable_contracts().
+if DEAL_AVAILABLE and os.environ.get("QORELOGIC_DISABLE_CONTRACTS"):
+    deal.disable(warn=False)
+
+
+def enable_contracts() -> bool:
+    """Turn on deal's runtime contract checks (for tests/CI)."""
+    if not DEAL_AVAILABLE:
+        return False
+    deal.enable()
+    return True
+
+
+def disable_contracts() -> bool:
+    """Turn off deal's runtime checks; decorators pass calls straight through."""
+    if not DEAL_AVAILABLE:
+        return False
+    deal.disable(warn=False)
+    return True
+
+
+# Remembers whether a callable carries deal contracts so uncontracted
+# functions skip the try/except frame on every subsequent call. Weak keys
+# let dynamically created functions be collected normally.
+_has_contract_cache: "WeakKeyDictionary[Callable, bool]" = WeakKeyDictionary()
+
 class ContractVerifier:
-    def __init__(self):
+    def __init__(self, enable_z3: bool = True):
         self.logger = logging.getLogger(__name__)
-        self.z3_available = Z3_AVAILABLE
+        self.z3_available = Z3_AVAILABLE and enable_z3
+        # One solver per verifier, reused across calls via push()/pop():
+        # Z3's tactic setup and AST interning survive between checks.
+        self._solver = None
+        self._var_cache: Dict[str, Any] = {}
+
+    def verify_contracts(self, func: Callable, *args, **kwargs) -> Tuple[bool, Optional[str]]:
+        """
+        Call func and report whether its deal contracts held.
+
+        Returns:
+            (passed, violation_message)
+        """
+        # Fast path: deal wraps decorated functions, so anything without a
+        # __wrapped__ attribute cannot raise a ContractError — call it
+        # directly and skip the exception machinery.
+        try:
+            has_contract = _has_contract_cache.get(func)
+        except TypeError:
+            has_contract = None  # unhashable callable; check every time
+        if has_contract is None:
+            has_contract = hasattr(func, "__wrapped__")
+            try:
+                _has_contract_cache[func] = has_contract
+            except TypeError:
+                pass
+
+        if not has_contract or not DEAL_AVAILABLE:
+            func(*args, **kwargs)
+            return True, None
+
+        try:
+            func(*args, **kwargs)
+            return True, None
+        except deal.ContractError as e:
+            return False, str(e)
 
     def verify_with_z3(self, constraints: Dict[str, Tuple[float, float]]) -> Tuple[bool, str]:
         """
@@ -31,32 +103,95 @@ class ContractVerifier:
         if not self.z3_available:
             return False, "Z3 solver not installed"
 
-        solver = z3.Solver()
-        
+        # Box constraints are independent per variable, so large sets are
+        # split across worker threads (one Z3 context each) instead of
+        # being fed to a single sequential solver.
+        if len(constraints) >= self._PARALLEL_THRESHOLD:
+            return self._verify_parallel(constraints)
+
+        if self._solver is None:
+            self._solver = z3.Solver()
+        solver = self._solver
+
+        solver.push()
         try:
             # Add constraints to solver
             for var_name, (min_val, max_val) in constraints.items():
-                # Create Z3 Real variable
-                z3_var = z3.Real(var_name)
-                
+                # Variables are interned per name so repeated calls reuse
+                # the same Z3 AST node
+                z3_var = self._var_cache.get(var_name)
+                if z3_var is None:
+                    z3_var = self._var_cache[var_name] = z3.Real(var_name)
+
                 # Add range constraints: min <= var <= max
                 solver.add(z3_var >= min_val)
                 solver.add(z3_var <= max_val)
-                
+
                 # Check for inherent contradiction in the range itself
                 if min_val > max_val:
-                    return False, f"Range contradiction for {var_name}: {min_val} > {max_val}"
+                    return False, f"Unsatisfiable: Range contradiction for {var_name}: {min_val} > {max_val}"
 
             # Check logical consistency
             result = solver.check()
-            
+
             if result == z3.sat:
                 return True, "Constraints are consistent"
             elif result == z3.unsat:
-                return False, "Constraints lead to logical contradiction (UNSAT)"
+                return False, "Unsatisfiable: Constraints lead to logical contradiction (UNSAT)"
             else:
                 return False, f"Solver output unknown: {result}"
-                
+
+        except Exception as e:
+            self.logger.error(f"Z3 verification error: {e}")
+            return False, f"Solver error: {str(e)}"
+        finally:
+            # Drop this call's constraints but keep the warm solver
+            solver.pop()
+
+    # Below this many variables the thread-pool setup costs more than it saves
+    _PARALLEL_THRESHOLD = 16
+
+    @staticmethod
+    def _check_component(items) -> Tuple[bool, str]:
+        """Check one independent constraint component in its own Z3 context."""
+        # Z3 requires a distinct context per thread
+        ctx = z3.Context()
+        solver = z3.Solver(ctx=ctx)
+        for var_name, (min_val, max_val) in items:
+            if min_val > max_val:
+                return False, f"Unsatisfiable: Range contradiction for {var_name}: {min_val} > {max_val}"
+            var = z3.Real(var_name, ctx)
+            solver.add(var >= min_val, var <= max_val)
+        result = solver.check()
+        if result == z3.sat:
+            return True, "Constraints are consistent"
+        if result == z3.unsat:
+            return False, "Unsatisfiable: Constraints lead to logical contradiction (UNSAT)"
+        return False, f"Solver output unknown: {result}"
+
+    def _verify_parallel(self, constraints: Dict[str, Tuple[float, float]]) -> Tuple[bool, str]:
+        """Dispatch independent box constraints across a thread pool."""
+        import os
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        workers = min(os.cpu_count() or 1, len(constraints))
+        # Box constraints share no variables: every (name, range) pair is
+        # its own connected component
+        chunks = list(constraints.items())
+        size = max(1, len(chunks) // workers)
+        components = [chunks[i:i + size] for i in range(0, len(chunks), size)]
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._check_component, c) for c in components]
+                for future in as_completed(futures):
+                    ok, msg = future.result()
+                    if not ok:
+                        # First UNSAT decides the answer; siblings are moot
+                        for f in futures:
+                            f.cancel()
+                        return False, msg
+            return True, "Constraints are consistent"
         except Exception as e:
             self.logger.error(f"Z3 verification error: {e}")
             return False, f"Solver error: {str(e)}"
@@ -13,7 +13,7 @@ import json
 import time
 import hashlib
 import sqlite3
-from typing import Optional, Tuple, Dict
+from typing import NamedTuple, Optional, Tuple, Dict
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -43,6 +43,116 @@ ARGON2_MEMORY_COST = 65536 # 64 MB
 ARGON2_PARALLELISM = 4     # Threads
 ARGON2_HASH_LEN = 32       # Output length for Fernet key
 
+
+class Argon2Params(NamedTuple):
+    """Tunable Argon2id work factors (time, memory in KiB, lanes)."""
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+
+
+# RFC 9106 §4 second recommendation — the production default, matching
+# the OWASP constants above
+RFC9106_LOW_MEMORY = Argon2Params(
+    ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM
+)
+# Reduced profile for dev boxes and validation runs, where a 64 MiB
+# memory-hard pass per init would dominate the measured latency
+DEV_LOW_MEMORY = Argon2Params(time_cost=2, memory_cost=15360, parallelism=1)
+
+# Calibrated work factors persist here so the benchmark runs once per
+# machine, not once per process
+ARGON2_PARAMS_PATH = Path(
+    os.environ.get("USERPROFILE") or os.environ.get("HOME") or "."
+) / ".qorelogic" / "argon2_params.json"
+
+
+def calibrate_argon2(
+    target_ms: int = 250,
+    mem_kib: int = ARGON2_MEMORY_COST,
+    parallelism: int = ARGON2_PARALLELISM,
+) -> Argon2Params:
+    """
+    Search time_cost for a wall time near target_ms on this hardware.
+
+    Memory stays fixed at the configured production budget — tuning at a
+    smaller memory cost miscalibrates, since Argon2 latency is dominated
+    by memory traffic, not iterations. Doubles time_cost while the run
+    is comfortably fast, steps back once on overshoot.
+    """
+    if not ARGON2_AVAILABLE:
+        return RFC9106_LOW_MEMORY
+
+    t = 1
+    while True:
+        start = time.perf_counter()
+        hash_secret_raw(
+            secret=b"calibration-probe",
+            salt=b"calibration-salt",
+            time_cost=t,
+            memory_cost=mem_kib,
+            parallelism=parallelism,
+            hash_len=ARGON2_HASH_LEN,
+            type=Type.ID,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms < target_ms * 0.5 and t < 64:
+            t *= 2
+            continue
+        if elapsed_ms > target_ms * 2 and t > 1:
+            t //= 2
+        break
+    return Argon2Params(t, mem_kib, parallelism)
+
+
+def _load_calibrated_params() -> Optional[Argon2Params]:
+    """Previously persisted work factors, or None."""
+    try:
+        with open(ARGON2_PARAMS_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return Argon2Params(
+            int(data["time_cost"]),
+            int(data["memory_cost"]),
+            int(data["parallelism"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_calibrated_params(params: Argon2Params) -> None:
+    """Persist work factors atomically (tmp + rename, as elsewhere)."""
+    try:
+        ARGON2_PARAMS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = str(ARGON2_PARAMS_PATH) + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(params._asdict(), f, indent=2)
+        os.replace(tmp_path, ARGON2_PARAMS_PATH)
+    except OSError:
+        pass  # Calibration still applies for this process
+
+
+def get_calibrated_params(target_ms: int = 250) -> Argon2Params:
+    """
+    Machine-appropriate Argon2id work factors: the persisted result if
+    one exists, else a one-time calibration run that is then saved.
+    Falls back to the RFC 9106 profile when argon2 is unavailable.
+    """
+    if not ARGON2_AVAILABLE:
+        return RFC9106_LOW_MEMORY
+    cached = _load_calibrated_params()
+    if cached is not None:
+        return cached
+    params = calibrate_argon2(target_ms)
+    _save_calibrated_params(params)
+    return params
+
+
+# Derived-key cache: the KDF is deliberately expensive, and tests /
+# validation scripts construct IdentityManager repeatedly with the same
+# passphrase and salt. Keyed on a blake2b digest of passphrase, salt and
+# params so the plaintext passphrase never sits in a dict key.
+_KDF_CACHE: Dict[bytes, bytes] = {}
+
 @dataclass
 class AgentIdentity:
     """Represents a cryptographic identity for an agent."""
@@ -72,15 +182,31 @@ class IdentityManager:
     - Rotation: Auto-upgrades legacy keys to Argon2id
     """
     
-    def __init__(self, passphrase: str = None):
+    def __init__(
+        self,
+        passphrase: str = None,
+        kdf_params: Optional[Argon2Params] = None,
+        keystore_dir: Optional[Path] = None,
+    ):
         """
         Initialize the identity manager.
-        
+
         Args:
             passphrase: Optional passphrase for encrypting keyfiles.
                        If None, checks QORELOGIC_IDENTITY_PASSPHRASE env var,
                        then falls back to default (NOT SECURE for production).
+            kdf_params: Argon2id work factors; pass DEV_LOW_MEMORY for
+                       test/validation runs where KDF latency matters.
+                       Defaults to the machine-calibrated profile (a
+                       one-time benchmark persisted per machine).
+            keystore_dir: Keyfile directory; defaults to the shared
+                       module keystore. Tests inject a tempdir here
+                       instead of monkey-patching the module global.
         """
+        self.kdf_params = kdf_params if kdf_params is not None else get_calibrated_params()
+        # Resolved at init (not def) time so legacy callers that patch
+        # the module global before construction still take effect
+        self.keystore_dir = Path(keystore_dir) if keystore_dir is not None else KEYSTORE_DIR
         env_pass = os.environ.get("QORELOGIC_IDENTITY_PASSPHRASE")
         
         # Secure storage path
@@ -106,7 +232,7 @@ class IdentityManager:
                 self._generate_and_save_secret()
             
         # Ensure keystore exists
-        KEYSTORE_DIR.mkdir(parents=True, exist_ok=True)
+        self.keystore_dir.mkdir(parents=True, exist_ok=True)
 
     def _generate_and_save_secret(self):
         """Generate a strong random passphrase and save it securely."""
@@ -139,29 +265,39 @@ class IdentityManager:
         Argon2id is memory-hard, providing resistance against GPU/ASIC attacks.
         PBKDF2 is retained for backward compatibility with existing keyfiles.
         """
-        if use_argon2 and ARGON2_AVAILABLE:
-            # Argon2id - GPU-resistant key derivation
-            derived_key = hash_secret_raw(
-                secret=self.passphrase.encode(),
-                salt=salt,
-                time_cost=ARGON2_TIME_COST,
-                memory_cost=ARGON2_MEMORY_COST,
-                parallelism=ARGON2_PARALLELISM,
-                hash_len=ARGON2_HASH_LEN,
-                type=Type.ID  # Argon2id variant
-            )
-            key = base64.urlsafe_b64encode(derived_key)
-        else:
-            # PBKDF2 fallback (legacy or when argon2 unavailable)
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-                backend=default_backend()
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(self.passphrase.encode()))
-        
+        argon2 = use_argon2 and ARGON2_AVAILABLE
+        params = self.kdf_params
+        cache_key = hashlib.blake2b(
+            self.passphrase.encode() + b"\x00" + salt +
+            (repr(params).encode() if argon2 else b"pbkdf2"),
+            digest_size=32
+        ).digest()
+        key = _KDF_CACHE.get(cache_key)
+        if key is None:
+            if argon2:
+                # Argon2id - GPU-resistant key derivation
+                derived_key = hash_secret_raw(
+                    secret=self.passphrase.encode(),
+                    salt=salt,
+                    time_cost=params.time_cost,
+                    memory_cost=params.memory_cost,
+                    parallelism=params.parallelism,
+                    hash_len=ARGON2_HASH_LEN,
+                    type=Type.ID  # Argon2id variant
+                )
+                key = base64.urlsafe_b64encode(derived_key)
+            else:
+                # PBKDF2 fallback (legacy or when argon2 unavailable)
+                kdf = PBKDF2HMAC(
+                    algorithm=hashes.SHA256(),
+                    length=32,
+                    salt=salt,
+                    iterations=100000,
+                    backend=default_backend()
+                )
+                key = base64.urlsafe_b64encode(kdf.derive(self.passphrase.encode()))
+            _KDF_CACHE[cache_key] = key
+
         return Fernet(key)
     
     def generate_did(self, role: str) -> str:
@@ -242,7 +378,7 @@ class IdentityManager:
         )
         
         # Save encrypted keyfile
-        keyfile_path = KEYSTORE_DIR / f"{did.replace(':', '_')}.key"
+        keyfile_path = self.keystore_dir / f"{did.replace(':', '_')}.key"
         keyfile_data = {
             "did": did,
             "role": role,
@@ -292,7 +428,7 @@ class IdentityManager:
         Returns:
             Tuple of (AgentIdentity, Ed25519PrivateKey)
         """
-        keyfile_path = KEYSTORE_DIR / f"{did.replace(':', '_')}.key"
+        keyfile_path = self.keystore_dir / f"{did.replace(':', '_')}.key"
         
         if not keyfile_path.exists():
             raise FileNotFoundError(f"Keyfile not found for {did}")
@@ -407,7 +543,7 @@ class IdentityManager:
         cipher = self._get_cipher(salt)
         encrypted_private = cipher.encrypt(self.serialize_private_key(new_private))
         
-        keyfile_path = KEYSTORE_DIR / f"{did.replace(':', '_')}.key"
+        keyfile_path = self.keystore_dir / f"{did.replace(':', '_')}.key"
         keyfile_data = {
             "did": did,
             "role": identity.role,
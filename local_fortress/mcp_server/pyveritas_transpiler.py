@@ -17,16 +17,75 @@ Modes:
 import os
 import re
 import json
+import time
 import logging
 import hashlib
+import threading
 import tempfile
 import subprocess
 from typing import Optional, Tuple, List, Dict
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from clang import cindex
+except ImportError:
+    cindex = None
+
 logger = logging.getLogger(__name__)
 
+# On-disk transpilation cache so fresh processes and CI reruns skip the
+# LLM round-trip for code they have already transpiled (same layout as
+# the CBMC result cache next door).
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "qorelogic", "transpile")
+
+# LLM output drifts as models are updated server-side, so cached C code
+# goes stale eventually even for identical input.
+_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+# Scratch dir for the C snippets handed to the fallback compilers: tmpfs
+# when the platform has it (no disk I/O for the write/read round-trip).
+_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# libclang parser state, created once per process (Index.create() loads
+# and initializes the shared library).
+_clang_index = None
+
+
+def _get_clang_index():
+    global _clang_index
+    if _clang_index is None and cindex is not None:
+        try:
+            _clang_index = cindex.Index.create()
+        except Exception as e:
+            logger.warning(f"libclang unavailable: {e}")
+    return _clang_index
+
+
+# Output-parsing patterns, compiled once rather than per call
+_CODE_BLOCK_RE = re.compile(r'```c?\n(.*?)```', re.DOTALL)
+_PY_LINE_RE = re.compile(r'//\s*PY:(\d+)')
+_C_LINE_RE = re.compile(r'^(#include|int |void |char |double |float |struct |if |for |while |return )')
+
+
+def _code_digest(python_code: str) -> str:
+    """Fast non-cryptographic digest for cache keys (collision resistance
+    matters here, preimage resistance does not)."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(python_code.encode())
+    return hashlib.blake2b(python_code.encode(), digest_size=16).hexdigest()
+
 
 class TranspilationStatus(Enum):
     """Status of transpilation attempt."""
@@ -105,7 +164,71 @@ class PyVeritasTranspiler:
         ]
         self.timeout_seconds = timeout_seconds
         self._cache: Dict[str, TranspilationResult] = {}
-    
+        if diskcache is not None:
+            try:
+                self._disk_cache = diskcache.Cache(_CACHE_DIR)
+            except Exception as e:
+                logger.warning(f"diskcache unavailable: {e}")
+                self._disk_cache = None
+        else:
+            self._disk_cache = None
+
+    def _cache_get(self, key: str) -> Optional[TranspilationResult]:
+        """Look up a prior successful transpilation (memory, then disk)."""
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        if self._disk_cache is not None:
+            data = self._disk_cache.get(key)
+        else:
+            try:
+                path = os.path.join(_CACHE_DIR, key + ".json")
+                if time.time() - os.path.getmtime(path) > _CACHE_TTL_SECONDS:
+                    return None
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError, KeyError):
+                return None
+        if not data:
+            return None
+
+        try:
+            result = TranspilationResult(
+                status=TranspilationStatus(data["status"]),
+                c_code=data["c_code"],
+                # JSON turns int keys into strings
+                python_line_map={int(k): v for k, v in data["python_line_map"].items()},
+                model_used=data["model_used"],
+                elapsed_ms=data["elapsed_ms"],
+                error_message=data.get("error_message", "")
+            )
+        except (KeyError, ValueError):
+            return None
+        self._cache[key] = result
+        return result
+
+    def _cache_put(self, key: str, result: TranspilationResult) -> None:
+        """Persist a successful transpilation to memory and disk."""
+        self._cache[key] = result
+        data = {
+            "status": result.status.value,
+            "c_code": result.c_code,
+            "python_line_map": result.python_line_map,
+            "model_used": result.model_used,
+            "elapsed_ms": result.elapsed_ms,
+            "error_message": result.error_message
+        }
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, data, expire=_CACHE_TTL_SECONDS)
+            return
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(os.path.join(_CACHE_DIR, key + ".json"), "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError:
+            pass
+
     def is_available(self) -> Tuple[bool, str]:
         """Check if LLM endpoint is available."""
         import requests
@@ -132,27 +255,45 @@ class PyVeritasTranspiler:
         Returns:
             TranspilationResult with C code or error
         """
-        import time
         start_time = time.time()
-        
-        # Check cache
-        code_hash = hashlib.md5(python_code.encode()).hexdigest()
-        if code_hash in self._cache:
+
+        # Check cache (keyed on the model too: switching primary_model
+        # must not serve C code generated by a different model)
+        code_hash = _code_digest(python_code)
+        cache_key = f"{code_hash}-{self.primary_model}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
             logger.debug(f"Cache hit for {code_hash[:8]}")
-            return self._cache[code_hash]
-        
-        # Try primary model, then fallbacks
+            return cached
+
+        # Try primary model, then fallbacks. Attempts run two at a time
+        # so a slow or failing primary no longer burns the whole timeout
+        # budget before the first fallback even starts.
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
         models_to_try = [self.primary_model] + self.fallback_models
-        
-        for model in models_to_try:
-            result = self._try_model(model, python_code, start_time)
-            if result.status == TranspilationStatus.SUCCESS:
-                self._cache[code_hash] = result
-                return result
-            elif result.status == TranspilationStatus.LLM_UNAVAILABLE:
-                # No point trying other models if endpoint is down
-                return result
-        
+
+        give_up = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self._MAX_PARALLEL_MODELS)
+        futures = [
+            executor.submit(self._try_model, model, python_code, start_time, give_up)
+            for model in models_to_try
+        ]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if result.status == TranspilationStatus.SUCCESS:
+                    self._cache_put(cache_key, result)
+                    return result
+                elif result.status == TranspilationStatus.LLM_UNAVAILABLE:
+                    # No point trying other models if endpoint is down
+                    return result
+        finally:
+            # Don't wait out a slow sibling attempt: queued models are
+            # cancelled and any in-flight request finishes in background.
+            give_up.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
         # All models failed
         elapsed = (time.time() - start_time) * 1000
         return TranspilationResult(
@@ -164,16 +305,32 @@ class PyVeritasTranspiler:
             error_message="All models failed to produce valid C code"
         )
     
+    # How many model attempts run concurrently; the rest stay queued so a
+    # burst of fallbacks does not hammer the endpoint.
+    _MAX_PARALLEL_MODELS = 2
+
     def _try_model(
-        self, 
-        model: str, 
-        python_code: str, 
-        start_time: float
+        self,
+        model: str,
+        python_code: str,
+        start_time: float,
+        give_up: Optional[threading.Event] = None
     ) -> TranspilationResult:
         """Attempt transpilation with a specific model."""
-        import time
         import requests
-        
+
+        # A sibling attempt already decided the outcome (success or a
+        # dead endpoint) — bail before issuing another request.
+        if give_up is not None and give_up.is_set():
+            return TranspilationResult(
+                status=TranspilationStatus.LLM_UNAVAILABLE,
+                c_code="",
+                python_line_map={},
+                model_used=model,
+                elapsed_ms=(time.time() - start_time) * 1000,
+                error_message="Attempt cancelled"
+            )
+
         prompt = TRANSPILE_PROMPT.format(python_code=python_code)
         
         try:
@@ -182,15 +339,16 @@ class PyVeritasTranspiler:
                 json={
                     "model": model,
                     "prompt": prompt,
-                    "stream": False,
+                    "stream": True,
                     "options": {
                         "temperature": 0.1,  # Low temp for determinism
                         "num_predict": 2000
                     }
                 },
-                timeout=self.timeout_seconds
+                timeout=self.timeout_seconds,
+                stream=True
             )
-            
+
             if response.status_code != 200:
                 return TranspilationResult(
                     status=TranspilationStatus.LLM_UNAVAILABLE,
@@ -200,13 +358,36 @@ class PyVeritasTranspiler:
                     elapsed_ms=(time.time() - start_time) * 1000,
                     error_message=f"HTTP {response.status_code}"
                 )
-            
-            data = response.json()
-            raw_output = data.get("response", "")
-            
-            # Extract C code from output
-            c_code = self._extract_c_code(raw_output)
-            
+
+            # Stream the completion: extraction only needs text up to the
+            # closing code fence, so stop reading (and close the socket,
+            # letting the server cancel generation) as soon as it appears
+            # instead of blocking for the full num_predict completion.
+            import json as _json
+            parts = []
+            fences = 0
+            tail = ""  # carry-over so a fence split across chunks still counts
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json.loads(line)
+                    piece = chunk.get("response", "")
+                    parts.append(piece)
+                    if chunk.get("done"):
+                        break
+                    window = tail + piece
+                    fences += window.count("```")
+                    tail = window[-2:]
+                    if fences >= 2:
+                        break
+            finally:
+                response.close()
+            raw_output = "".join(parts)
+
+            # Extract C code and line mapping from output in one pass
+            c_code, line_map = self._parse_llm_output(raw_output)
+
             if not c_code:
                 return TranspilationResult(
                     status=TranspilationStatus.INVALID_OUTPUT,
@@ -230,9 +411,6 @@ class PyVeritasTranspiler:
                     error_message=compile_error
                 )
             
-            # Extract line mapping
-            line_map = self._extract_line_map(c_code)
-            
             elapsed = (time.time() - start_time) * 1000
             return TranspilationResult(
                 status=TranspilationStatus.SUCCESS,
@@ -261,36 +439,72 @@ class PyVeritasTranspiler:
                 error_message=str(e)
             )
     
-    def _extract_c_code(self, raw_output: str) -> str:
-        """Extract C code from LLM output."""
+    def _parse_llm_output(self, raw_output: str) -> Tuple[str, Dict[int, int]]:
+        """
+        Extract C code and its line mapping from LLM output in one pass.
+
+        Returns:
+            (c_code, line_map) where line_map is C line -> Python line
+        """
         # Look for code block
-        code_match = re.search(r'```c?\n(.*?)```', raw_output, re.DOTALL)
+        code_match = _CODE_BLOCK_RE.search(raw_output)
         if code_match:
-            return code_match.group(1).strip()
-        
-        # If no code block, try to find C-like content
-        lines = raw_output.strip().split('\n')
-        c_lines = []
-        in_code = False
-        
-        for line in lines:
-            # Heuristic: looks like C code
-            if re.match(r'^(#include|int |void |char |double |float |struct |if |for |while |return )', line):
-                in_code = True
-            if in_code:
-                c_lines.append(line)
-        
-        return '\n'.join(c_lines).strip()
-    
+            c_code = code_match.group(1).strip()
+        else:
+            # If no code block, try to find C-like content
+            lines = raw_output.strip().split('\n')
+            c_lines = []
+            in_code = False
+
+            for line in lines:
+                # Heuristic: looks like C code
+                if _C_LINE_RE.match(line):
+                    in_code = True
+                if in_code:
+                    c_lines.append(line)
+
+            c_code = '\n'.join(c_lines).strip()
+
+        # Single walk over the extracted code collects the // PY:N markers
+        line_map: Dict[int, int] = {}
+        for c_line_num, line in enumerate(c_code.splitlines(), 1):
+            match = _PY_LINE_RE.search(line)
+            if match:
+                line_map[c_line_num] = int(match.group(1))
+
+        return c_code, line_map
+
     def _validate_c_syntax(self, c_code: str) -> Tuple[bool, str]:
         """Validate C code compiles (syntax check only)."""
-        # Try GCC first, then Clang
+        # In-process path: libclang parses the translation unit without
+        # paying fork+exec+compiler startup per transpile attempt, and
+        # unsaved_files means no temp file ever hits disk.
+        index = _get_clang_index()
+        if index is not None:
+            try:
+                tu = index.parse(
+                    "snippet.c",
+                    args=["-fsyntax-only"],
+                    unsaved_files=[("snippet.c", c_code)]
+                )
+                errors = [
+                    str(d) for d in tu.diagnostics
+                    if d.severity >= cindex.Diagnostic.Error
+                ]
+                if errors:
+                    return False, "\n".join(errors)[:500]
+                return True, ""
+            except Exception as e:
+                logger.debug(f"libclang parse failed, using subprocess: {e}")
+
+        # Subprocess fallback: try GCC first, then Clang
         compilers = ["gcc", "clang"]
-        
+
         with tempfile.NamedTemporaryFile(
-            mode='w', 
-            suffix='.c', 
+            mode='w',
+            suffix='.c',
             delete=False,
+            dir=_TMP_DIR,
             encoding='utf-8'
         ) as tmp:
             tmp.write(c_code)
@@ -324,19 +538,6 @@ class PyVeritasTranspiler:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
     
-    def _extract_line_map(self, c_code: str) -> Dict[int, int]:
-        """Extract C line -> Python line mapping from comments."""
-        line_map = {}
-        
-        for c_line_num, line in enumerate(c_code.splitlines(), 1):
-            # Look for // PY:N pattern
-            match = re.search(r'//\s*PY:(\d+)', line)
-            if match:
-                py_line = int(match.group(1))
-                line_map[c_line_num] = py_line
-        
-        return line_map
-
 
 # Singleton accessor
 _transpiler = None
@@ -410,5 +611,5 @@ def transpile_and_verify(python_code: str) -> Dict:
             })
         result["mapped_violations"] = mapped_violations
     
-    result["status"] = verify_result.status.value.lower()
+    result["status"] = verify_result.status.name.lower()
     return result
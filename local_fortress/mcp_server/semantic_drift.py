@@ -9,9 +9,12 @@ Spec: §7.1
 """
 import numpy as np
 import sqlite3
+import hashlib
 import json
 import pickle
 import logging
+import threading
+from collections import OrderedDict
 from typing import Optional, Tuple, List, Dict
 from datetime import datetime
 
@@ -21,11 +24,66 @@ try:
 except ImportError:
     MODEL_AVAILABLE = False
 
+# Optional ONNX Runtime backend: graph-level fusion beats PyTorch eager
+# per-op dispatch for MiniLM-class encoders on CPU
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
+# Either backend can serve get_model()
+ENCODER_AVAILABLE = MODEL_AVAILABLE or ORT_AVAILABLE
+
 # Configuration
 DRIFT_THRESHOLD = 0.85  # Spec §7.1
+
+# Distinguishes "caller didn't pass a baseline" from "there is none yet"
+_UNSET = object()
 BASELINE_ALPHA = 0.1    # Update rate for baseline (10% new, 90% history)
 MODEL_NAME = 'all-MiniLM-L6-v2'
 
+class _OrtEncoder:
+    """
+    encode()-compatible adapter over an ONNX Runtime MiniLM session.
+
+    Mirrors the slice of the SentenceTransformer.encode signature this
+    module uses (batch_size / normalize_embeddings / convert_to_numpy),
+    with mean pooling + optional L2 norm done in numpy.
+    """
+
+    def __init__(self, model_name: str):
+        repo = f"sentence-transformers/{model_name}"
+        self._model = ORTModelForFeatureExtraction.from_pretrained(
+            repo, export=True, provider="CPUExecutionProvider"
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(repo)
+
+    def encode(self, texts, batch_size: int = 32,
+               normalize_embeddings: bool = False,
+               convert_to_numpy: bool = True) -> np.ndarray:
+        single = isinstance(texts, str)
+        if single:
+            texts = [texts]
+
+        chunks = []
+        for i in range(0, len(texts), batch_size):
+            enc = self._tokenizer(
+                texts[i:i + batch_size],
+                padding=True, truncation=True, return_tensors="np"
+            )
+            hidden = np.asarray(self._model(**enc).last_hidden_state)
+            mask = enc["attention_mask"][..., None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            chunks.append(pooled)
+
+        emb = np.concatenate(chunks, axis=0)
+        if normalize_embeddings:
+            emb = emb / (np.linalg.norm(emb, axis=1, keepdims=True) + 1e-12)
+        return emb[0] if single else emb
+
+
 class SemanticDriftMonitor:
     """
     Monitors semantic drift using sentence embeddings.
@@ -36,31 +94,112 @@ class SemanticDriftMonitor:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        # Pooled connection: a drift stream hits the DB per check, and
+        # re-opening pays header parse + PRAGMAs + lock acquisition each time
+        self._conn = None
+        self._conn_lock = threading.Lock()
+        # Write-through baseline cache: read-mostly checks skip the DB
+        self._baseline_cache: Dict[str, np.ndarray] = {}
+        # Embedding memo (LRU): retries and test loops resubmit identical
+        # content, and a hash is ~6 orders cheaper than a transformer pass
+        self._embed_cache: OrderedDict = OrderedDict()
+
+    # Bound on memoized embeddings (LRU eviction)
+    _EMBED_CACHE_SIZE = 1024
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return the shared DB connection, creating it on first use."""
+        if self._conn is None:
+            with self._conn_lock:
+                if self._conn is None:
+                    conn = sqlite3.connect(
+                        self.db_path, check_same_thread=False,
+                        cached_statements=64
+                    )
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    self._conn = conn
+        return self._conn
 
     @classmethod
     def get_model(cls):
-        """Lazy load the embedding model."""
-        if not MODEL_AVAILABLE:
+        """Lazy load the embedding model (ONNX Runtime first, then torch)."""
+        if not ENCODER_AVAILABLE:
             return None
-            
-        if cls._model is None:
+
+        if cls._model is None and ORT_AVAILABLE:
+            try:
+                cls._model = _OrtEncoder(MODEL_NAME)
+            except Exception as e:
+                logging.warning(f"ONNX backend failed ({e}), trying torch")
+
+        if cls._model is None and MODEL_AVAILABLE:
             # This might download the model on first run (~80MB)
             try:
-                cls._model = SentenceTransformer(MODEL_NAME)
+                # CPU + eval: inference-only module, no autograd state.
+                # HF loads safetensors weights via mmap, so when several
+                # MCP workers fork after this point the ~80MB of weight
+                # pages are shared through the page cache instead of
+                # being duplicated per worker RSS.
+                cls._model = SentenceTransformer(MODEL_NAME, device='cpu')
+                cls._model.eval()
+                try:
+                    import torch
+                    # One intra-op thread per worker: sibling workers
+                    # already provide the parallelism, and oversubscribed
+                    # MKL/OpenMP pools thrash each other
+                    torch.set_num_threads(1)
+                except ImportError:
+                    pass
             except Exception as e:
                 logging.error(f"Failed to load model {MODEL_NAME}: {e}")
+                cls._model = None
                 return None
         return cls._model
 
     def compute_embedding(self, text: str) -> Optional[np.ndarray]:
-        """Generate embedding for text."""
+        """Generate embedding for text (memoized by content hash)."""
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._embed_cache.get(key)
+        if cached is not None:
+            self._embed_cache.move_to_end(key)
+            return cached
+
         model = self.get_model()
         if model is None:
             return None
-        
+
         try:
             # model.encode returns numpy array by default
-            return model.encode(text)
+            embedding = model.encode(text)
+        except Exception as e:
+            self.logger.error(f"Embedding generation failed: {e}")
+            return None
+
+        self._embed_cache[key] = embedding
+        if len(self._embed_cache) > self._EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
+        return embedding
+
+    def compute_embeddings(self, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Generate embeddings for several texts in one encode call.
+
+        Batching amortizes the per-call tokenizer and model-launch cost,
+        and normalize_embeddings=True pre-normalizes rows so similarity
+        reduces to a dot product.
+        """
+        model = self.get_model()
+        if model is None:
+            return None
+
+        try:
+            return model.encode(
+                texts,
+                batch_size=32,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
         except Exception as e:
             self.logger.error(f"Embedding generation failed: {e}")
             return None
@@ -75,25 +214,71 @@ class SemanticDriftMonitor:
             
         return np.dot(a, b) / (norm_a * norm_b)
 
+    # Leading tag byte of the quantized format. Raw float32 blobs are
+    # always a multiple of 4 bytes; the tagged layout (1-byte tag +
+    # 4-byte scale + one byte per dim) never is, so the two can't collide.
+    _INT8_TAG = b'\x01'
+
+    @staticmethod
+    def _quantize(v: np.ndarray) -> Tuple[np.ndarray, np.float32]:
+        """Symmetric per-vector int8 quantization: returns (codes, scale)."""
+        v = np.asarray(v, dtype=np.float32)
+        peak = float(np.max(np.abs(v)))
+        scale = (peak / 127.0) if peak > 0 else 1.0
+        codes = np.clip(np.round(v / scale), -127, 127).astype(np.int8)
+        return codes, np.float32(scale)
+
+    @classmethod
+    def _deserialize_baseline(cls, blob: bytes) -> np.ndarray:
+        """
+        Decode a stored baseline. Current rows are int8 codes plus a
+        float32 scale (4x smaller than float32, 8x smaller than the
+        original pickled float64); raw-float32 and pickled rows written
+        by older versions are still understood and get converted on the
+        next update_baseline call.
+        """
+        if blob[:1] == b'\x80':
+            vec = np.asarray(pickle.loads(blob), dtype=np.float32)
+        elif blob[:1] == cls._INT8_TAG and len(blob) % 4 == 1:
+            scale = np.frombuffer(blob[1:5], dtype=np.float32)[0]
+            codes = np.frombuffer(blob[5:], dtype=np.int8)
+            vec = codes.astype(np.float32) * scale
+        else:
+            vec = np.frombuffer(blob, dtype=np.float32)
+        # Re-normalized once per cold read (quantization and legacy rows
+        # drift slightly off unit length) so checks are a bare dot product
+        return vec / (np.linalg.norm(vec) + 1e-12)
+
     def get_baseline(self, agent_did: str) -> Optional[np.ndarray]:
         """Retrieve baseline embedding for an agent."""
+        cached = self._baseline_cache.get(agent_did)
+        if cached is not None:
+            return cached
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT baseline_embedding FROM semantic_baselines WHERE agent_did = ?",
-                    (agent_did,)
-                )
-                row = cursor.fetchone()
-                if row and row[0]:
-                    return pickle.loads(row[0])
+            row = self._get_conn().execute(
+                "SELECT baseline_embedding FROM semantic_baselines WHERE agent_did = ?",
+                (agent_did,)
+            ).fetchone()
+            if row and row[0]:
+                baseline = self._deserialize_baseline(row[0])
+                self._baseline_cache[agent_did] = baseline
+                return baseline
         except Exception as e:
             self.logger.error(f"Error reading baseline for {agent_did}: {e}")
         return None
 
-    def update_baseline(self, agent_did: str, current_embedding: np.ndarray):
-        """Update the baseline embedding using EWMA."""
-        baseline = self.get_baseline(agent_did)
-        
+    def update_baseline(self, agent_did: str, current_embedding: np.ndarray,
+                        baseline=_UNSET):
+        """
+        Update the baseline embedding using EWMA.
+
+        Callers that already fetched the baseline (check_drift) pass it
+        in, collapsing the old SELECT + SELECT + INSERT sequence into the
+        single UPSERT below.
+        """
+        if baseline is _UNSET:
+            baseline = self.get_baseline(agent_did)
+
         if baseline is None:
             new_baseline = current_embedding
             sample_count = 1
@@ -109,10 +294,27 @@ class SemanticDriftMonitor:
             # but usually embeddings are normalized.
             sample_count = 1 # Just increment (logic below)
 
-        serialized = pickle.dumps(new_baseline)
+        # Stored as an L2 unit vector so each check is one dot product
+        # instead of two norms + a division
+        new_baseline = np.asarray(new_baseline, dtype=np.float32)
+        new_baseline = new_baseline / (np.linalg.norm(new_baseline) + 1e-12)
+
+        # int8 codes + scale: a quarter of the float32 payload, decoded
+        # with np.frombuffer (no pickle opcode interpreter). Quantization
+        # error on a 384-dim unit vector is ~1e-3 in similarity, well
+        # inside the drift threshold's margin.
+        codes, scale = self._quantize(new_baseline)
+        serialized = self._INT8_TAG + scale.tobytes() + codes.tobytes()
+
+        # Cache what a DB read would return (the dequantized, re-unit
+        # vector) so subsequent checks agree with a cold-start read
+        dequant = codes.astype(np.float32) * scale
+        self._baseline_cache[agent_did] = dequant / (np.linalg.norm(dequant) + 1e-12)
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            # Connection context manager commits the transaction without
+            # closing the pooled connection
+            with self._get_conn() as conn:
                 conn.execute(
                     """
                     INSERT INTO semantic_baselines (agent_did, baseline_embedding, sample_count, last_updated)
@@ -124,7 +326,6 @@ class SemanticDriftMonitor:
                     """,
                     (agent_did, serialized)
                 )
-                conn.commit()
         except Exception as e:
             self.logger.error(f"Error updating baseline for {agent_did}: {e}")
 
@@ -135,31 +336,94 @@ class SemanticDriftMonitor:
         Returns:
             (has_drift, similarity_score, message)
         """
-        if not MODEL_AVAILABLE:
+        if not ENCODER_AVAILABLE:
             return False, 1.0, "Model unavailable"
 
         embedding = self.compute_embedding(content)
         if embedding is None:
             return False, 0.0, "Embedding failed"
-            
+
+        return self._check_with_embedding(agent_did, embedding)
+
+    def check_drift_batch(self, items: List[Tuple[str, str]]) -> List[Tuple[bool, float, str]]:
+        """
+        Check several (agent_did, content) pairs with one batched encode.
+
+        Returns:
+            One (has_drift, similarity_score, message) per input item.
+        """
+        if not ENCODER_AVAILABLE:
+            return [(False, 1.0, "Model unavailable")] * len(items)
+        if not items:
+            return []
+
+        embeddings = self.compute_embeddings([content for _, content in items])
+        if embeddings is None:
+            return [(False, 0.0, "Embedding failed")] * len(items)
+
+        return [
+            self._check_with_embedding(agent_did, embedding)
+            for (agent_did, _), embedding in zip(items, embeddings)
+        ]
+
+    def check_drift_many(self, agent_dids: List[str],
+                         contents: List[str]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Cross-check N baselines against M candidate contents in one GEMM.
+
+        For multi-persona agents this replaces N*M Python-level dot
+        products with a single B @ C.T over row-normalized matrices.
+
+        Returns:
+            (similarities[N, M], has_drift[N, M]), or None when the
+            encoder is unavailable. Agents without a stored baseline get
+            a zero row (always flagged as drift).
+        """
+        if not agent_dids or not contents:
+            return np.zeros((len(agent_dids), 0)), np.zeros((len(agent_dids), 0), dtype=bool)
+
+        candidates = self.compute_embeddings(contents)
+        if candidates is None:
+            return None
+
+        dim = candidates.shape[1]
+        rows = []
+        for did in agent_dids:
+            baseline = self.get_baseline(did)
+            if baseline is None:
+                rows.append(np.zeros(dim, dtype=np.float32))
+            else:
+                rows.append(baseline)  # already unit-length
+        baselines = np.vstack(rows)
+
+        # Rows are unit vectors, so the product is the cosine matrix
+        similarities = baselines @ candidates.T
+        return similarities, similarities < DRIFT_THRESHOLD
+
+    def _check_with_embedding(self, agent_did: str, embedding: np.ndarray) -> Tuple[bool, float, str]:
+        """Drift decision for one agent given its already-computed embedding."""
         baseline = self.get_baseline(agent_did)
-        
+
         if baseline is None:
             # First observation, set baseline
-            self.update_baseline(agent_did, embedding)
+            self.update_baseline(agent_did, embedding, baseline=None)
             return False, 1.0, "Baseline initialized"
-            
-        similarity = self.cosine_similarity(baseline, embedding)
-        
+
+        # Baselines come back unit-length from get_baseline, so only the
+        # fresh embedding needs a norm; cosine is then one dot product
+        embedding = np.asarray(embedding, dtype=np.float32)
+        embedding = embedding / (np.linalg.norm(embedding) + 1e-12)
+        similarity = float(baseline @ embedding)
+
         has_drift = similarity < DRIFT_THRESHOLD
-        
+
         # Update baseline only if NO drift (don't learn from bad data)??
         # Or update slowly?
         # Usually, if it's a hallucination (drift), we DON'T want to update baseline to include it.
         if not has_drift:
-            self.update_baseline(agent_did, embedding)
+            self.update_baseline(agent_did, embedding, baseline=baseline)
             msg = f"Similarity {similarity:.3f} >= {DRIFT_THRESHOLD}"
         else:
             msg = f"DRIFT DETECTED: Similarity {similarity:.3f} < {DRIFT_THRESHOLD}"
-            
+
         return has_drift, similarity, msg
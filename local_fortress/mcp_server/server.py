@@ -164,14 +164,11 @@ def get_reputation_recovery():
         _reputation_recovery = ReputationRecovery()
     return _reputation_recovery
 
-_traffic_monitor = None
-
 def get_traffic_monitor():
-    global _traffic_monitor
-    if _traffic_monitor is None:
-        from .traffic_control import get_traffic_monitor as _get_tm
-        _traffic_monitor = _get_tm()
-    return _traffic_monitor
+    # traffic_control owns the singleton; re-caching it here would give
+    # the app two sources of truth for admission bookkeeping
+    from .traffic_control import get_traffic_monitor as _get_tm
+    return _get_tm()
 
 _system_monitor = None
 
@@ -10,16 +10,34 @@ Spec: §2.5.1 (Backpressure), §12 (Operational Modes)
 - C2.2: Queue depth >50 → SURGE mode
 - C2.3: Security event → SAFE mode
 """
-from threading import Lock, Thread, Event
+from threading import BoundedSemaphore, Lock, Thread, Event
 import time
 import psutil
 import sqlite3
 import logging
 from typing import Optional, Dict, Any
 from contextlib import contextmanager
-from collections import deque
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .telemetry_manager import AtomicCounter, sampled_cpu_percent
+
+# This module is the single owner of the backpressure/mode-transition
+# singletons; importers must go through the accessors below rather than
+# instantiating their own monitors.
+__all__ = [
+    "BackpressureMonitor",
+    "OperationalMode",
+    "SystemMonitor",
+    "get_traffic_monitor",
+    "get_system_monitor",
+]
+
+
 class BackpressureMonitor:
     """
     Monitors concurrent request load and enforces backpressure.
@@ -28,52 +46,59 @@ class BackpressureMonitor:
     
     def __init__(self, capacity: int = 50):
         self.capacity = capacity
-        # Use simple counter + lock for active requests
-        # (Since we don't have a real queue object for sync calls, we count concurrency)
-        self._active_requests = 0
-        self._lock = Lock()
-        
+        # Admission control is a semaphore (acquire/release run in C),
+        # so entry and exit don't serialize on a shared Python lock.
+        # The counter exists only for status reporting.
+        self._sem = BoundedSemaphore(capacity) if capacity > 0 else None
+        self._active = AtomicCounter()
+
+    # Back-compat alias: tests and older callers read/poke the raw count
+    @property
+    def _active_requests(self) -> int:
+        return self._active.get()
+
+    @_active_requests.setter
+    def _active_requests(self, value: int):
+        self._active.set(value)
+
     @property
     def utilization(self) -> float:
-        with self._lock:
-            if self.capacity == 0: return 0.0
-            return self._active_requests / self.capacity
-            
+        if self.capacity == 0: return 0.0
+        return self._active.get() / self.capacity
+
     @contextmanager
     def request_access(self):
         """
         Context manager for checking backpressure.
         Raises RuntimeError (503) if overloaded.
         """
-        with self._lock:
-            if self._active_requests >= self.capacity:
-                raise RuntimeError("503 Service Unavailable: Backpressure limit reached (Queue Full)")
-            
-            self._active_requests += 1
-            
+        if self._sem is None or not self._sem.acquire(blocking=False):
+            raise RuntimeError("503 Service Unavailable: Backpressure limit reached (Queue Full)")
+
+        self._active.inc()
         try:
             yield
         finally:
-            with self._lock:
-                self._active_requests -= 1
+            self._active.inc(-1)
+            self._sem.release()
 
     def get_status(self) -> dict:
         """Get current traffic status."""
-        with self._lock:
-            util = self._active_requests / self.capacity if self.capacity > 0 else 0
-            
-            status = "OK"
-            if util >= 1.0:
-                status = "OVERLOAD"
-            elif util >= 0.8:
-                status = "WARNING"
-                
-            return {
-                "active_requests": self._active_requests,
-                "capacity": self.capacity,
-                "utilization": round(util, 2),
-                "status": status
-            }
+        active = self._active.get()
+        util = active / self.capacity if self.capacity > 0 else 0
+
+        status = "OK"
+        if util >= 1.0:
+            status = "OVERLOAD"
+        elif util >= 0.8:
+            status = "WARNING"
+
+        return {
+            "active_requests": active,
+            "capacity": self.capacity,
+            "utilization": round(util, 2),
+            "status": status
+        }
 
 # Singleton instance
 _monitor = BackpressureMonitor()
@@ -99,6 +124,26 @@ CPU_THRESHOLD = 70.0          # % CPU usage to trigger LEAN mode
 CPU_SAMPLE_WINDOW = 5 * 60    # 5 minutes in seconds
 QUEUE_SURGE_THRESHOLD = 50    # Queue depth to trigger SURGE mode
 QUEUE_WARNING_THRESHOLD = 40  # 80% of max (50 * 0.8)
+CPU_SAMPLE_INTERVAL = 1.0     # Seconds between CPU samples within a cycle
+
+# Poll queries as module constants so sqlite3's per-connection statement
+# cache reuses the prepared statements across cycles
+_SQL_GET_MODE = "SELECT current_mode FROM system_state WHERE state_id = 1"
+_SQL_SET_MODE = """
+    UPDATE system_state
+    SET current_mode = ?,
+        mode_changed_at = CURRENT_TIMESTAMP,
+        mode_reason = ?
+    WHERE state_id = 1
+"""
+_SQL_QUEUE_DEPTH = "SELECT COUNT(1) FROM l3_approval_queue WHERE status = 'PENDING'"
+
+# Partial index so the depth poll counts only pending rows instead of
+# scanning the whole (ever-growing) approval queue table
+_SQL_QUEUE_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_l3_queue_pending
+    ON l3_approval_queue(status) WHERE status = 'PENDING'
+"""
 
 
 class SystemMonitor:
@@ -123,9 +168,25 @@ class SystemMonitor:
         self.poll_interval = poll_interval
         self.logger = logging.getLogger(__name__)
 
-        # CPU monitoring state
-        self.cpu_samples = deque(maxlen=int(CPU_SAMPLE_WINDOW / poll_interval))
+        # CPU monitoring state: a fixed ring buffer sampled once per
+        # second (better p95 signal than one point per poll cycle),
+        # window still 5 minutes. A running sum makes the window mean
+        # O(1) instead of re-summing 300 samples every poll.
+        self._cpu_capacity = int(CPU_SAMPLE_WINDOW / CPU_SAMPLE_INTERVAL)
+        if np is not None:
+            self._cpu_buf = np.zeros(self._cpu_capacity, dtype=np.float32)
+        else:
+            self._cpu_buf = [0.0] * self._cpu_capacity
+        self._cpu_idx = 0
+        self._cpu_filled = 0
+        self._cpu_sum = 0.0
+        # Aggregates recomputed once per poll cycle, so status scrapes
+        # are plain field reads no matter how often they arrive
+        self._last_avg_cpu = 0.0
+        self._last_p95_cpu = 0.0
         self.last_cpu_check = time.time()
+        # Prime the shared sampler so the first delta reading is sane
+        sampled_cpu_percent()
 
         # Queue monitoring state
         self.current_queue_depth = 0
@@ -134,6 +195,39 @@ class SystemMonitor:
         self.stop_event = Event()
         self.monitor_thread: Optional[Thread] = None
 
+        # One pooled connection for every poll cycle; opening a fresh
+        # connection per query paid setup cost and a cold page cache
+        # twice per cycle. Guarded by _db_lock since both the monitor
+        # thread and trigger_safe_mode callers touch it.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = Lock()
+        self._init_indices()
+
+    def _init_indices(self):
+        """Ensure the pending-queue partial index exists."""
+        try:
+            with self._db_lock:
+                conn = self._get_db()
+                conn.execute(_SQL_QUEUE_INDEX)
+                conn.commit()
+        except sqlite3.Error as e:
+            # Queue table may not exist yet on a fresh ledger; the count
+            # query degrades to a scan until it does.
+            self.logger.debug(f"Pending-queue index not created: {e}")
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Pooled connection, created lazily (call with _db_lock held)."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.db_path,
+                timeout=10,
+                check_same_thread=False,
+                cached_statements=64
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
     def start_monitoring(self):
         """Start the monitoring thread."""
         if self.monitor_thread and self.monitor_thread.is_alive():
@@ -156,33 +250,65 @@ class SystemMonitor:
         """Main monitoring loop."""
         while not self.stop_event.is_set():
             try:
+                # Sample CPU once per second until the next poll; the
+                # non-blocking sampler keeps the cadence accurate (the
+                # old interval=1.0 call blocked the thread for 10% of
+                # every cycle)
+                deadline = time.monotonic() + self.poll_interval
+                while time.monotonic() < deadline:
+                    self._record_cpu_sample(sampled_cpu_percent())
+                    if self.stop_event.wait(CPU_SAMPLE_INTERVAL):
+                        return
+
                 # Check CPU
                 self._check_cpu()
 
                 # Check queue depth
                 self._check_queue_depth()
 
-                # Sleep until next poll
-                time.sleep(self.poll_interval)
-
             except Exception as e:
                 self.logger.error(f"Error in monitor loop: {e}", exc_info=True)
 
+    def _record_cpu_sample(self, value: float):
+        """Write one sample into the ring, keeping the running sum."""
+        if self._cpu_filled == self._cpu_capacity:
+            # Ring is full: the slot being overwritten leaves the window
+            self._cpu_sum -= float(self._cpu_buf[self._cpu_idx])
+        else:
+            self._cpu_filled += 1
+        self._cpu_buf[self._cpu_idx] = value
+        # Add the value as stored (float32-rounded under numpy) so the
+        # running sum stays consistent with later eviction
+        self._cpu_sum += float(self._cpu_buf[self._cpu_idx])
+        self._cpu_idx = (self._cpu_idx + 1) % self._cpu_capacity
+
+    def _cpu_p95(self) -> float:
+        """95th-percentile CPU over the current window."""
+        if not self._cpu_filled:
+            return 0.0
+        if np is not None:
+            return float(np.percentile(self._cpu_buf[:self._cpu_filled], 95))
+        window = sorted(self._cpu_buf[:self._cpu_filled])
+        return window[int((len(window) - 1) * 0.95)]
+
     def _check_cpu(self):
         """
         Monitor CPU usage and trigger LEAN mode if sustained high usage.
         Spec §12: CPU >70% for 5 minutes → LEAN mode
         """
         try:
-            cpu_percent = psutil.cpu_percent(interval=1.0)
-            self.cpu_samples.append(cpu_percent)
+            # Samples are collected by the monitor loop; this only
+            # evaluates the window
+            if self._cpu_filled:
+                self._last_avg_cpu = self._cpu_sum / self._cpu_filled
+                self._last_p95_cpu = self._cpu_p95()
 
             # Need full window of samples
-            if len(self.cpu_samples) < self.cpu_samples.maxlen:
+            if self._cpu_filled < self._cpu_capacity:
                 return
 
-            # Calculate average over window
-            avg_cpu = sum(self.cpu_samples) / len(self.cpu_samples)
+            # Running sum makes the window average O(1)
+            avg_cpu = self._last_avg_cpu
 
             current_mode = self._get_current_mode()
 
@@ -250,12 +376,11 @@ class SystemMonitor:
     def _get_current_mode(self) -> OperationalMode:
         """Query current operational mode from database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT current_mode FROM system_state WHERE state_id = 1")
-                row = cursor.fetchone()
-                if row:
-                    return OperationalMode(row[0])
-                return OperationalMode.NORMAL
+            with self._db_lock:
+                row = self._get_db().execute(_SQL_GET_MODE).fetchone()
+            if row:
+                return OperationalMode(row[0])
+            return OperationalMode.NORMAL
         except Exception as e:
             self.logger.error(f"Error reading current mode: {e}")
             return OperationalMode.NORMAL
@@ -269,18 +394,9 @@ class SystemMonitor:
             reason: Reason for the transition
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Update system_state table
-                conn.execute(
-                    """
-                    UPDATE system_state
-                    SET current_mode = ?,
-                        mode_changed_at = CURRENT_TIMESTAMP,
-                        mode_reason = ?
-                    WHERE state_id = 1
-                    """,
-                    (new_mode.value, reason)
-                )
+            with self._db_lock:
+                conn = self._get_db()
+                conn.execute(_SQL_SET_MODE, (new_mode.value, reason))
                 conn.commit()
 
             self.logger.info(f"Mode transition: → {new_mode.value} ({reason})")
@@ -296,12 +412,9 @@ class SystemMonitor:
             Number of pending requests
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM l3_approval_queue WHERE status = 'PENDING'"
-                )
-                row = cursor.fetchone()
-                return row[0] if row else 0
+            with self._db_lock:
+                row = self._get_db().execute(_SQL_QUEUE_DEPTH).fetchone()
+            return row[0] if row else 0
         except Exception as e:
             self.logger.error(f"Error reading queue depth: {e}")
             return 0
@@ -313,12 +426,11 @@ class SystemMonitor:
         Returns:
             Dictionary with current metrics
         """
-        avg_cpu = sum(self.cpu_samples) / len(self.cpu_samples) if self.cpu_samples else 0.0
-
         return {
             "current_mode": self._get_current_mode().value,
-            "cpu_percent_avg": round(avg_cpu, 1),
-            "cpu_samples_count": len(self.cpu_samples),
+            "cpu_percent_avg": round(self._last_avg_cpu, 1),
+            "cpu_percent_p95": round(self._last_p95_cpu, 1),
+            "cpu_samples_count": self._cpu_filled,
             "queue_depth": self.current_queue_depth,
             "cpu_threshold": CPU_THRESHOLD,
             "queue_threshold": QUEUE_SURGE_THRESHOLD,
@@ -13,6 +13,16 @@ from enum import Enum, auto
 from typing import List, Optional
 import deal
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # Lambda Decay Parameters (Spec §5.3.3)
 LAMBDA_HIGH_RISK = 0.94  # Reactive: ~95% weight on last 60 observations
 LAMBDA_LOW_RISK = 0.97   # Stable: Tolerates minor variance
@@ -22,9 +32,15 @@ DAMPING_FACTOR = 0.5
 MAX_HOPS = 3
 
 class TrustContext(Enum):
-    """Context for risk-based decay parameters."""
-    LOW_RISK = auto()   # L1/L2 Tasks (Docs, Routine Code)
-    HIGH_RISK = auto()  # L3 Tasks (Security, Crypto, PII)
+    """
+    Context for risk-based decay parameters.
+
+    Values are explicit integers usable as indices into the engine's
+    lambda lookup table, so batch callers can pass plain int code
+    arrays instead of Enum members.
+    """
+    LOW_RISK = 0    # L1/L2 Tasks (Docs, Routine Code)
+    HIGH_RISK = 1   # L3 Tasks (Security, Crypto, PII)
 
 class TrustStage(Enum):
     """
@@ -52,12 +68,73 @@ PROBATION_VERIFICATIONS = 5
 PROBATION_DURATION = 30 * 24 * 3600
 PROBATION_FLOOR_SCI = 0.35 # Normalized 35/100
 
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _transitive_trust_kernel(paths, lens, damping, max_hops):  # pragma: no cover
+        """Compiled kernel: derived trust for N padded candidate paths."""
+        out = np.zeros(paths.shape[0], dtype=np.float32)
+        for i in prange(paths.shape[0]):
+            n = lens[i]
+            if n == 0 or n > max_hops:
+                continue  # trust evaporates; leave 0.0
+            trust = paths[i, 0]
+            for k in range(1, n):
+                trust = trust * paths[i, k] * damping
+            out[i] = trust
+        return out
+
+    @njit(cache=True)
+    def _ewma_kernel(lam, current, outcome):  # pragma: no cover
+        """Compiled kernel: single EWMA multiply-add."""
+        return lam * current + (1.0 - lam) * outcome
+
+    @njit(cache=True)
+    def _micro_penalty_kernel(current, adjusted, remaining_cap):  # pragma: no cover
+        """Compiled kernel: capped penalty application."""
+        applied = min(adjusted, remaining_cap)
+        new_score = current - applied
+        if new_score < 0.0:
+            new_score = 0.0
+        return new_score, applied
+
+    @njit(cache=True)
+    def _transitive_scalar_kernel(path, damping):  # pragma: no cover
+        """Compiled kernel: damped product along one trust path."""
+        trust = path[0]
+        for k in range(1, path.shape[0]):
+            trust = trust * path[k] * damping
+        return trust
+else:
+    _ewma_kernel = None
+    _micro_penalty_kernel = None
+    _transitive_scalar_kernel = None
+
+
 # Loss Aversion Multiplier (Research: BEHAVIORAL_ECONOMICS.md §4.1)
 # Kahneman-Tversky finding: losses hurt 2.25x more than equivalent gains.
 # Implementation uses 2.0 as conservative middle ground per RESEARCH_VALIDATION.md.
 LOSS_AVERSION_LAMBDA = 2.0
 
 class TrustEngine:
+    def __init__(self):
+        # Closed-form decay rate: 0.01 per 30 days, folded into one
+        # per-second multiplier so each evaluation is a single multiply
+        # (sweeps hit every trust record, so the two divisions add up)
+        self._decay_rate_per_sec = 0.01 / 2_592_000.0
+
+        # Context -> lambda as a dict lookup; cheaper than the enum
+        # __eq__ branch on the per-update hot path
+        self._lambdas = {
+            TrustContext.HIGH_RISK: LAMBDA_HIGH_RISK,
+            TrustContext.LOW_RISK: LAMBDA_LOW_RISK,
+        }
+        # Positional lookup table indexed by TrustContext.value, for
+        # batch paths that carry per-element int context codes
+        if np is not None:
+            self._lambda_lut = np.array([LAMBDA_LOW_RISK, LAMBDA_HIGH_RISK], dtype=np.float32)
+        else:
+            self._lambda_lut = (LAMBDA_LOW_RISK, LAMBDA_HIGH_RISK)
+
     @deal.post(lambda result: 0.0 < result <= 1.0)
     @deal.post(lambda result: result in [LAMBDA_HIGH_RISK, LAMBDA_LOW_RISK])
     def get_lambda(self, context: TrustContext) -> float:
@@ -69,9 +146,7 @@ class TrustEngine:
         - POST: Result must be between 0.0 and 1.0 (exclusive lower, inclusive upper)
         - POST: Result must be one of the defined lambda values
         """
-        if context == TrustContext.HIGH_RISK:
-            return LAMBDA_HIGH_RISK
-        return LAMBDA_LOW_RISK
+        return self._lambdas[context]
 
     @deal.pre(lambda _self, current_score, *args, **kwargs: 0.0 <= current_score <= 1.0)
     @deal.pre(lambda _self, _score, outcome_score, *args, **kwargs: 0.0 <= outcome_score <= 1.0)
@@ -95,11 +170,54 @@ class TrustEngine:
         Returns:
             Updated trust score (float)
         """
-        lam = self.get_lambda(context)
+        # Inlined lambda lookup skips the contracted method frame
+        lam = self._lambdas[context]
+        if _ewma_kernel is not None:
+            return float(_ewma_kernel(lam, current_score, outcome_score))
         # EWMA Formula: New = Old * Lambda + New * (1 - Lambda)
         new_score = (lam * current_score) + ((1 - lam) * outcome_score)
         return new_score
 
+    def calculate_ewma_update_batch(self, current_scores, outcome_scores, context):
+        """
+        Vectorized EWMA over aligned score/outcome sequences.
+
+        Callers that accumulate updates over an audit batch pay the
+        Python dispatch once instead of per score; the recurrence itself
+        is a single SIMD multiply-add over contiguous float32 arrays.
+        Contract checking is handled by the scalar path — inputs here
+        are expected pre-validated by the batch producer.
+
+        Args:
+            current_scores: Current trust metrics (array-like)
+            outcome_scores: New event scores, aligned with current_scores
+            context: Either one TrustContext applied to the whole batch,
+                or a sequence of int context codes (TrustContext.value)
+                aligned with the scores for per-element lambda selection
+
+        Returns:
+            Updated trust scores (np.ndarray when NumPy is available,
+            list of floats otherwise)
+        """
+        if np is not None:
+            if isinstance(context, TrustContext):
+                lam = self._lambdas[context]
+            else:
+                # Enum-free per-element selection via the lookup table
+                lam = self._lambda_lut[np.asarray(context, dtype=np.intp)]
+            current = np.asarray(current_scores, dtype=np.float32)
+            outcome = np.asarray(outcome_scores, dtype=np.float32)
+            return lam * current + (1.0 - lam) * outcome
+
+        if isinstance(context, TrustContext):
+            lams = [self._lambdas[context]] * len(current_scores)
+        else:
+            lams = [self._lambda_lut[code] for code in context]
+        return [
+            (lam * c) + ((1 - lam) * o)
+            for lam, c, o in zip(lams, current_scores, outcome_scores)
+        ]
+
     @deal.pre(lambda _self, current_score, *args, **kwargs: 0.0 <= current_score <= 1.0)
     @deal.pre(lambda _self, _cs, last_update_ts, *args, **kwargs: last_update_ts >= 0)
     @deal.pre(lambda _self, _cs, _ts, baseline=0.4, *args, **kwargs: 0.0 <= baseline <= 1.0)
@@ -127,15 +245,17 @@ class TrustEngine:
         if last_update_ts > now:
             return current_score # Guard against future timestamps
 
-        days_inactive = (now - last_update_ts) / (24 * 3600)
+        delta = now - last_update_ts
 
-        if days_inactive <= 0:
+        # One-day floor: sub-day inactivity produces drift below score
+        # resolution, so skip the arithmetic entirely
+        if delta < 86400:
             return current_score
 
         # Rate: 1% drift per 30 days (assuming 0-1 scale) ??
         # Spec says "1 point per 30 days" (on 0-100 scale).
         # On 0.0-1.0 scale, this is 0.01 per 30 days.
-        decay_amount = (days_inactive / 30.0) * 0.01
+        decay_amount = delta * self._decay_rate_per_sec
 
         if current_score > baseline:
             return max(baseline, current_score - decay_amount)
@@ -144,7 +264,44 @@ class TrustEngine:
 
         return current_score
 
-    
+    def calculate_temporal_decay_batch(self, scores, last_update_ts, now: Optional[float] = None, baseline: float = 0.4):
+        """
+        Vectorized temporal decay over aligned score/timestamp arrays.
+
+        Ledger-wide decay sweeps touch every trust record; this applies
+        the same drift-toward-baseline rule in a handful of NumPy
+        expressions instead of one method call per record. Future
+        timestamps and sub-day inactivity leave scores unchanged,
+        matching the scalar method.
+
+        Returns np.ndarray when NumPy is available, list otherwise.
+        """
+        if now is None:
+            now = time.time()
+        if np is None:
+            out = []
+            for score, ts in zip(scores, last_update_ts):
+                delta = now - ts
+                if delta < 86400:
+                    out.append(score)
+                    continue
+                decay = delta * self._decay_rate_per_sec
+                if score > baseline:
+                    out.append(max(baseline, score - decay))
+                elif score < baseline:
+                    out.append(min(baseline, score + decay))
+                else:
+                    out.append(score)
+            return out
+
+        score_arr = np.asarray(scores, dtype=np.float32)
+        delta = now - np.asarray(last_update_ts, dtype=np.float64)
+        decay = np.where(delta < 86400, 0.0, delta * self._decay_rate_per_sec).astype(np.float32)
+        above = np.maximum(baseline, score_arr - decay)
+        below = np.minimum(baseline, score_arr + decay)
+        return np.where(score_arr > baseline, above,
+                        np.where(score_arr < baseline, below, score_arr))
+
     # --- A3: Lewicki-Bunker Stages (Spec §5.3.6) ---
     
     def get_trust_stage(self, score: float) -> TrustStage:
@@ -221,6 +378,13 @@ class TrustEngine:
 
         # Check remaining cap
         remaining_cap = max(0.0, DAILY_PENALTY_CAP - daily_penalty_sum)
+
+        if _micro_penalty_kernel is not None:
+            new_score, applied_penalty = _micro_penalty_kernel(
+                current_score, adjusted_penalty, remaining_cap
+            )
+            return float(new_score), float(applied_penalty)
+
         applied_penalty = min(adjusted_penalty, remaining_cap)
 
         # Apply to score
@@ -282,6 +446,11 @@ class TrustEngine:
         if len(trust_path) > MAX_HOPS:
             return 0.0  # Trust evaporates beyond max hops
 
+        if _transitive_scalar_kernel is not None:
+            return float(_transitive_scalar_kernel(
+                np.asarray(trust_path, dtype=np.float64), DAMPING_FACTOR
+            ))
+
         # Start with the first link
         trust = trust_path[0]
         
@@ -298,6 +467,68 @@ class TrustEngine:
 
         return trust
 
+    def calculate_transitive_trust_batch(self, trust_paths: List[List[float]]) -> List[float]:
+        """
+        Derived trust for many candidate paths at once.
+
+        Graph traversals evaluate thousands of paths per sweep; routing
+        them through the compiled kernel (Numba, when installed) avoids
+        interpreter dispatch per path. Paths are padded into an (N,
+        MAX_HOPS) float32 matrix for the kernel; over-length or empty
+        paths yield 0.0, matching the scalar method. Without Numba the
+        padded matrix goes through a NumPy product reduction instead;
+        small batches and NumPy-less installs use the plain loop — not
+        worth the padding copy.
+        """
+        if np is None or len(trust_paths) <= 1:
+            return [self._transitive_scalar(path) for path in trust_paths]
+
+        if njit is None:
+            return self._transitive_batch_numpy(trust_paths)
+
+        n = len(trust_paths)
+        width = max(MAX_HOPS, max((len(p) for p in trust_paths), default=0))
+        paths = np.zeros((n, width), dtype=np.float32)
+        lens = np.zeros(n, dtype=np.int64)
+        for i, path in enumerate(trust_paths):
+            lens[i] = len(path)
+            if path and len(path) <= width:
+                paths[i, :len(path)] = path
+        out = _transitive_trust_kernel(paths, lens, DAMPING_FACTOR, MAX_HOPS)
+        return [float(v) for v in out]
+
+    @staticmethod
+    def _transitive_batch_numpy(trust_paths: List[List[float]]) -> List[float]:
+        """
+        NumPy fallback for the batch path when Numba is absent.
+
+        Padding with ones makes the row product ignore unused slots, so
+        the damped chain product collapses to one C-level reduction:
+        prod(path) * δ^(hops-1). Empty and over-length paths zero out,
+        matching the scalar method.
+        """
+        n = len(trust_paths)
+        width = max(MAX_HOPS, max((len(p) for p in trust_paths), default=0))
+        paths = np.ones((n, width), dtype=np.float64)
+        lens = np.zeros(n, dtype=np.int64)
+        for i, path in enumerate(trust_paths):
+            lens[i] = len(path)
+            if path:
+                paths[i, :len(path)] = path
+        out = paths.prod(axis=1) * DAMPING_FACTOR ** np.maximum(lens - 1, 0)
+        out[(lens == 0) | (lens > MAX_HOPS)] = 0.0
+        return [float(v) for v in out]
+
+    @staticmethod
+    def _transitive_scalar(trust_path: List[float]) -> float:
+        """Contract-free scalar fallback used by the batch path."""
+        if not trust_path or len(trust_path) > MAX_HOPS:
+            return 0.0
+        trust = trust_path[0]
+        for next_link in trust_path[1:]:
+            trust = trust * next_link * DAMPING_FACTOR
+        return trust
+
     # --- Phase 10: Trust Conservation (EigenTrust L1 Norm) ---
     
     @deal.pre(lambda _self, scores: all(0.0 <= s <= 1.0 for s in scores))
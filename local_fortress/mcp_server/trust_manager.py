@@ -7,10 +7,16 @@ Spec: §5.3 (Trust Dynamics)
 
 [L3] Critical security component - manages agent trust scores and history
 """
+import atexit
+import queue
 import sqlite3
+import threading
 import time
 from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import date
+from threading import Event, Lock, Thread
 import logging
 
 from .trust_engine import (
@@ -20,6 +26,125 @@ from .trust_engine import (
     MicroPenaltyType
 )
 
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# UPDATE ... RETURNING needs SQLite >= 3.35
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Hot-path SQL hoisted to module constants: every call site then passes
+# the identical string, so sqlite3's per-connection statement cache
+# reuses the prepared statement instead of re-parsing the text.
+_SQL_GET_TRUST = "SELECT trust_score FROM agent_registry WHERE did = ?"
+
+_SQL_GET_EWMA_STATE = """
+    SELECT trust_score, verification_count, created_at, created_at_epoch
+    FROM agent_registry
+    WHERE did = ?
+"""
+
+_SQL_UPDATE_EWMA = """
+    UPDATE agent_registry
+    SET trust_score = ?,
+        trust_stage = ?,
+        last_trust_update = CURRENT_TIMESTAMP,
+        last_trust_update_epoch = ?,
+        verification_count = verification_count + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE did = ?
+"""
+
+_SQL_UPDATE_EWMA_BULK = """
+    UPDATE agent_registry
+    SET trust_score = ?,
+        trust_stage = ?,
+        last_trust_update = CURRENT_TIMESTAMP,
+        last_trust_update_epoch = ?,
+        verification_count = verification_count + ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE did = ?
+"""
+
+_SQL_INSERT_HISTORY = """
+    INSERT INTO trust_updates (
+        agent_did, old_score, new_score, delta,
+        update_type, context, ledger_ref_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_DECAY_STATE = """
+    SELECT trust_score, last_trust_update, last_trust_update_epoch
+    FROM agent_registry
+    WHERE did = ?
+"""
+
+_SQL_UPDATE_SCORE = """
+    UPDATE agent_registry
+    SET trust_score = ?,
+        trust_stage = ?,
+        last_trust_update = CURRENT_TIMESTAMP,
+        last_trust_update_epoch = ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE did = ?
+"""
+
+_SQL_GET_PENALTY_STATE = """
+    SELECT trust_score, daily_penalty_sum, penalty_reset_date, penalty_reset_day
+    FROM agent_registry
+    WHERE did = ?
+"""
+
+_SQL_GET_HISTORY = """
+    SELECT *
+    FROM trust_updates
+    WHERE agent_did = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+# Read-through trust cache bounds: short TTL keeps cross-process writers
+# from serving stale scores for more than a couple of seconds
+_TRUST_CACHE_SIZE = 10_000
+_TRUST_CACHE_TTL_S = 2.0
+
+# History writer batching: how long an audit row may wait in the queue
+# and how many rows one flush transaction may carry
+_HIST_FLUSH_INTERVAL_S = 0.01
+_HIST_FLUSH_BATCH_ROWS = 256
+
+
+class _TTLDict:
+    """Minimal stand-in for cachetools.TTLCache when it is unavailable."""
+    __slots__ = ("_data", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if expires < time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def __setitem__(self, key, value):
+        data = self._data
+        if key not in data and len(data) >= self._maxsize:
+            data.popitem(last=False)
+        data[key] = (time.monotonic() + self._ttl, value)
+        data.move_to_end(key)
+
+    def pop(self, key, default=None):
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
 
 class TrustManager:
     """
@@ -38,26 +163,253 @@ class TrustManager:
         self.engine = TrustEngine()
         self.logger = logging.getLogger(__name__)
 
-    def get_agent_trust(self, agent_did: str) -> Optional[float]:
+        # One connection per thread, opened lazily and kept for the
+        # thread's lifetime. Under WAL, readers then scale with request
+        # threads instead of queueing on a Python lock, and SQLite
+        # itself arbitrates the single writer slot — write transactions
+        # open BEGIN IMMEDIATE to take it up front rather than paying
+        # the deferred-to-write upgrade retry.
+        self._local = threading.local()
+        self._conns: List[sqlite3.Connection] = []
+        self._conns_lock = Lock()
+        self._schema_ready = False
+        atexit.register(self._close_all)
+
+        # Read-through score cache: get_agent_trust is hit many times per
+        # request (stage checks, gating), and a dict lookup beats even a
+        # page-cache-warm SELECT. Writers invalidate their agent's entry;
+        # the short TTL bounds staleness from out-of-process writers.
+        self._cache_lock = Lock()
+        if TTLCache is not None:
+            self._trust_cache = TTLCache(maxsize=_TRUST_CACHE_SIZE, ttl=_TRUST_CACHE_TTL_S)
+        else:
+            self._trust_cache = _TTLDict(maxsize=_TRUST_CACHE_SIZE, ttl=_TRUST_CACHE_TTL_S)
+
+        # Write-behind history log: trust_updates is an append-only audit
+        # trail, so scalar update paths enqueue their row after the
+        # registry commit instead of riding the foreground transaction.
+        # A single daemon writer drains batches, which both amortizes the
+        # fsync and preserves global insertion order. Batch entry points
+        # keep their inline executemany — they already commit once.
+        self._hist_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=65536)
+        self._hist_stop = Event()
+        self._hist_thread = Thread(target=self._history_flush_loop, daemon=True)
+        self._hist_thread.start()
+        atexit.register(self.flush_history)
+
+    @contextmanager
+    def _get_db(self):
+        """Per-thread pooled connection, created lazily with tuned pragmas."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=10,
+                # Default cache holds 128 statements; trust flows plus
+                # registry maintenance overflow it under load
+                cached_statements=256
+            )
+            # WAL halves per-commit disk syncs and lets readers
+            # proceed during writes; the rest keep hot paths in
+            # memory (20 MB page cache, in-memory temp store)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA busy_timeout=5000")
+            # Bound WAL growth now that several threads write
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+            # Map the db file read-only into the process: history
+            # reads skip the userspace page-cache copy entirely
+            conn.execute("PRAGMA mmap_size=268435456")
+            with self._conns_lock:
+                # Migrations run once, not per thread
+                if not self._schema_ready:
+                    self._ensure_epoch_columns(conn)
+                    self._ensure_indices(conn)
+                    self._schema_ready = True
+                self._conns.append(conn)
+            self._local.conn = conn
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+
+    @contextmanager
+    def _get_ro_db(self):
+        """
+        Per-thread read-only connection for hot lookups. Opened with
+        mode=ro and query_only, it can never take the write lock, so
+        score reads proceed regardless of what writers are doing.
+        Raises sqlite3.OperationalError if the database file does not
+        exist yet — callers fall back to the read-write pool, which
+        creates it.
+        """
+        conn = getattr(self._local, "ro_conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                timeout=10,
+                cached_statements=256
+            )
+            conn.execute("PRAGMA query_only=1")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA cache_size=-20000")
+            # Read the mapped file directly instead of copying pages
+            # into the connection cache
+            conn.execute("PRAGMA mmap_size=268435456")
+            with self._conns_lock:
+                self._conns.append(conn)
+            self._local.ro_conn = conn
+        yield conn
+
+    def _close_all(self):
+        """Close every pooled connection (process shutdown)."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def _read_trust_row(self, agent_did: str):
+        """One-row score lookup, preferring the read-only connection."""
+        try:
+            with self._get_ro_db() as conn:
+                return conn.execute(_SQL_GET_TRUST, (agent_did,)).fetchone()
+        except sqlite3.OperationalError:
+            # No ro handle available (fresh ledger, exotic path); the
+            # rw pool creates the file and serves the read
+            with self._get_db() as conn:
+                return conn.execute(_SQL_GET_TRUST, (agent_did,)).fetchone()
+
+    def _ensure_epoch_columns(self, conn: sqlite3.Connection):
+        """
+        Idempotent migration: mirror the TIMESTAMP columns as integer
+        epochs so hot paths read an int instead of reparsing
+        "YYYY-MM-DD HH:MM:SS" strings through datetime on every event.
+        """
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(agent_registry)")}
+        # penalty_reset_day holds date.toordinal() so the daily-reset
+        # check is one int compare instead of a fromisoformat parse
+        for col in ("last_trust_update_epoch", "created_at_epoch", "penalty_reset_day"):
+            if col not in existing:
+                conn.execute(f"ALTER TABLE agent_registry ADD COLUMN {col} INTEGER")
+        conn.commit()
+
+    def _ensure_indices(self, conn: sqlite3.Connection):
+        """
+        Best-effort supporting indexes. get_trust_history filters on
+        agent_did and orders by timestamp DESC; the composite index turns
+        its per-agent filesort into a direct range scan.
+        """
+        try:
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_trust_updates_agent_ts
+                ON trust_updates(agent_did, timestamp DESC)
+                """
+            )
+            # Covering index for the scalar score lookup: SQLite has no
+            # INCLUDE clause, but listing trust_score as a trailing key
+            # column answers SELECT trust_score WHERE did=? from the
+            # index alone, without touching the table b-tree
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_agent_registry_did_score
+                ON agent_registry(did, trust_score)
+                """
+            )
+            conn.commit()
+        except sqlite3.OperationalError:
+            # Table not created yet (fresh ledger); the next manager
+            # restart picks it up
+            pass
+
+    def _record_history(self, row: tuple):
+        """Queue one trust_updates row for the background writer."""
+        try:
+            self._hist_queue.put_nowait(row)
+        except queue.Full:
+            # Writer has fallen behind; drain synchronously and retry
+            self.flush_history()
+            self._hist_queue.put_nowait(row)
+
+    def _history_flush_loop(self):
+        while not self._hist_stop.is_set():
+            try:
+                first = self._hist_queue.get(timeout=_HIST_FLUSH_INTERVAL_S)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < _HIST_FLUSH_BATCH_ROWS:
+                try:
+                    batch.append(self._hist_queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_history(batch)
+
+    def _write_history(self, rows: List[tuple]):
+        """Insert a batch of history rows in one transaction."""
+        try:
+            with self._get_db() as conn:
+                conn.executemany(_SQL_INSERT_HISTORY, rows)
+                conn.commit()
+        except sqlite3.Error as e:
+            # Put the rows back so a later flush retries them
+            for row in rows:
+                try:
+                    self._hist_queue.put_nowait(row)
+                except queue.Full:
+                    break
+            self.logger.error("Trust history flush failed: %s", e)
+
+    def flush_history(self):
+        """Synchronously drain all queued history rows to disk."""
+        rows = []
+        while True:
+            try:
+                rows.append(self._hist_queue.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            self._write_history(rows)
+
+    def _invalidate_trust(self, *agent_dids: str):
+        """Drop cached scores after a write lands."""
+        with self._cache_lock:
+            for did in agent_dids:
+                self._trust_cache.pop(did, None)
+
+    def get_agent_trust(self, agent_did: str, force_fresh: bool = False) -> Optional[float]:
         """
         Get current trust score for an agent.
 
         Args:
             agent_did: Agent DID
+            force_fresh: Bypass the read-through cache and hit the DB
 
         Returns:
             Trust score (0.0-1.0) or None if agent not found
         """
+        if not force_fresh:
+            with self._cache_lock:
+                score = self._trust_cache.get(agent_did)
+            if score is not None:
+                return score
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT trust_score FROM agent_registry WHERE did = ?",
-                    (agent_did,)
-                )
-                row = cursor.fetchone()
-                return row[0] if row else None
+            row = self._read_trust_row(agent_did)
+            if not row:
+                return None
+            with self._cache_lock:
+                self._trust_cache[agent_did] = row[0]
+            return row[0]
         except Exception as e:
-            self.logger.error(f"Error reading trust score for {agent_did}: {e}")
+            self.logger.error("Error reading trust score for %s: %s", agent_did, e)
             return None
 
     def update_trust_ewma(
@@ -80,23 +432,36 @@ class TrustManager:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Get current trust score
-                cursor = conn.execute(
-                    """
-                    SELECT trust_score, verification_count, created_at
-                    FROM agent_registry
-                    WHERE did = ?
-                    """,
-                    (agent_did,)
-                )
+            with self._get_db() as conn:
+                # Take the write lock up front: the read and both writes
+                # form one read-modify-write, and starting IMMEDIATE
+                # avoids the deferred-to-write lock upgrade mid-
+                # transaction. (A full SELECT+UPDATE fusion via
+                # RETURNING is not possible here — scoring runs through
+                # the contracted TrustEngine in Python, and RETURNING
+                # only exposes the post-update row. Pushing the EWMA
+                # into SQL with create_function() was also considered
+                # and rejected: the pre-image is still needed for the
+                # history delta and stage derivation, so the SELECT
+                # stays either way, it would bypass the engine's deal
+                # contracts, and scalar UDFs call back into Python per
+                # row anyway — the per-event round trip is instead
+                # amortized by update_trust_batch.)
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.execute(_SQL_GET_EWMA_STATE, (agent_did,))
                 row = cursor.fetchone()
                 if not row:
-                    self.logger.error(f"Agent {agent_did} not found")
+                    conn.rollback()
+                    self.logger.error("Agent %s not found", agent_did)
                     return False
 
-                current_score, verification_count, created_at = row
-                created_timestamp = self._parse_timestamp(created_at)
+                current_score, verification_count, created_at, created_epoch = row
+                # Epoch column is a direct int fetch; the string parse is
+                # only a legacy fallback for pre-migration rows
+                created_timestamp = (
+                    created_epoch if created_epoch is not None
+                    else self._parse_timestamp(created_at)
+                )
 
                 # Check if in probation
                 in_probation = self.engine.is_in_probation(created_timestamp, verification_count)
@@ -104,7 +469,7 @@ class TrustManager:
                 # Calculate new score
                 if outcome_score < 0.5:
                     # [P1] Critical: Enforce stage demotion on failure (Spec §5.3.6)
-                    self.logger.warning(f"Trust Violation (Outcome={outcome_score}). Enforcing demotion.")
+                    self.logger.warning("Trust Violation (Outcome=%s). Enforcing demotion.", outcome_score)
                     new_score = self.engine.calculate_violation_penalty(current_score)
                 else:
                     # Standard EWMA update
@@ -119,30 +484,129 @@ class TrustManager:
                     probation_floor = self.engine.get_probation_floor()
                     new_score = max(new_score, probation_floor)
 
-                # Update agent_registry
+                # Update agent_registry; RETURNING confirms the write
+                # landed without a follow-up read
                 new_stage = self.engine.get_trust_stage(new_score).name
-                conn.execute(
-                    """
-                    UPDATE agent_registry
-                    SET trust_score = ?,
-                        trust_stage = ?,
-                        last_trust_update = CURRENT_TIMESTAMP,
-                        verification_count = verification_count + 1,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE did = ?
-                    """,
-                    (new_score, new_stage, agent_did)
+                if _HAS_RETURNING:
+                    written = conn.execute(
+                        _SQL_UPDATE_EWMA + " RETURNING trust_score",
+                        (new_score, new_stage, int(time.time()), agent_did)
+                    ).fetchone()
+                    if not written:
+                        conn.rollback()
+                        self.logger.error("Agent %s vanished mid-update", agent_did)
+                        return False
+                else:
+                    conn.execute(_SQL_UPDATE_EWMA, (new_score, new_stage, int(time.time()), agent_did))
+
+                conn.commit()
+                self._invalidate_trust(agent_did)
+                # Audit row goes through the write-behind queue; the
+                # registry write above stays synchronous for
+                # read-your-writes
+                self._record_history((
+                    agent_did,
+                    current_score,
+                    new_score,
+                    new_score - current_score,
+                    'EWMA_UPDATE',
+                    f"{context.name} (outcome={outcome_score})",
+                    ledger_ref_id
+                ))
+
+                # %-style args defer formatting until a handler
+                # actually consumes the record
+                self.logger.info(
+                    "Trust updated for %s: %.3f → %.3f (Δ=%+.3f, context=%s)",
+                    agent_did, current_score, new_score,
+                    new_score - current_score, context.name
                 )
 
-                # Record in trust_updates history
-                conn.execute(
-                    """
-                    INSERT INTO trust_updates (
-                        agent_did, old_score, new_score, delta,
-                        update_type, context, ledger_ref_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                return True
+
+        except Exception as e:
+            self.logger.error("Error updating trust for %s: %s", agent_did, e, exc_info=True)
+            return False
+
+    def update_trust_batch(
+        self,
+        events: List[tuple]
+    ) -> List[bool]:
+        """
+        Apply a batch of EWMA trust updates in a single transaction.
+
+        Each commit costs an fsync, so a verification run that updates N
+        agents one call at a time pays N disk syncs; batching collapses
+        them into one. Current rows are prefetched with a single
+        SELECT ... IN, scores computed in Python via the engine, then the
+        registry UPDATEs and history INSERTs are issued via executemany.
+
+        Args:
+            events: List of (agent_did, outcome_score, context,
+                ledger_ref_id) tuples; ledger_ref_id may be None.
+
+        Returns:
+            Per-event success flags, in input order.
+        """
+        if not events:
+            return []
+
+        results = [False] * len(events)
+        try:
+            with self._get_db() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+
+                # One round trip for every agent touched by the batch
+                dids = list({e[0] for e in events})
+                placeholders = ",".join("?" * len(dids))
+                cursor = conn.execute(
+                    f"""
+                    SELECT did, trust_score, verification_count,
+                           created_at, created_at_epoch
+                    FROM agent_registry
+                    WHERE did IN ({placeholders})
                     """,
-                    (
+                    dids
+                )
+                current = {
+                    row[0]: (
+                        row[1],
+                        row[2],
+                        row[4] if row[4] is not None else self._parse_timestamp(row[3])
+                    )
+                    for row in cursor.fetchall()
+                }
+
+                upd_rows = []
+                hist_rows = []
+                for i, event in enumerate(events):
+                    agent_did, outcome_score, context = event[0], event[1], event[2]
+                    ledger_ref_id = event[3] if len(event) > 3 else None
+                    state = current.get(agent_did)
+                    if state is None:
+                        self.logger.error("Agent %s not found", agent_did)
+                        continue
+
+                    current_score, verification_count, created_ts = state
+                    in_probation = self.engine.is_in_probation(
+                        created_ts,
+                        verification_count
+                    )
+
+                    if outcome_score < 0.5:
+                        new_score = self.engine.calculate_violation_penalty(current_score)
+                    else:
+                        new_score = self.engine.calculate_ewma_update(
+                            current_score,
+                            outcome_score,
+                            context
+                        )
+                    if in_probation:
+                        new_score = max(new_score, self.engine.get_probation_floor())
+
+                    new_stage = self.engine.get_trust_stage(new_score).name
+                    upd_rows.append((new_score, new_stage, int(time.time()), agent_did))
+                    hist_rows.append((
                         agent_did,
                         current_score,
                         new_score,
@@ -150,20 +614,113 @@ class TrustManager:
                         'EWMA_UPDATE',
                         f"{context.name} (outcome={outcome_score})",
                         ledger_ref_id
-                    )
+                    ))
+                    # Later events in the batch see this event's result
+                    current[agent_did] = (new_score, verification_count + 1, created_ts)
+                    results[i] = True
+
+                if upd_rows:
+                    conn.executemany(_SQL_UPDATE_EWMA, upd_rows)
+                    conn.executemany(_SQL_INSERT_HISTORY, hist_rows)
+
+                conn.commit()
+                self._invalidate_trust(*dids)
+                self.logger.info(
+                    "Batch trust update: %d/%d events applied",
+                    len(upd_rows), len(events)
+                )
+                return results
+
+        except Exception as e:
+            self.logger.error("Error in batch trust update: %s", e, exc_info=True)
+            return [False] * len(events)
+
+    def update_trust_ewma_bulk(
+        self,
+        agent_did: str,
+        outcomes: List[float],
+        context: TrustContext,
+        ledger_ref_id: Optional[int] = None
+    ) -> bool:
+        """
+        Fold a sequence of outcomes for one agent into a single write.
+
+        Semantically identical to calling update_trust_ewma once per
+        outcome — the EWMA chain, demotion branch and probation floor all
+        run per step in Python — but the registry pays one UPDATE and one
+        commit instead of N. Experiment harnesses that hammer one agent
+        use this to keep DB-write variance out of their measurements.
+
+        Args:
+            agent_did: Agent DID
+            outcomes: Verification outcomes in order (0.0=FAIL, 1.0=PASS)
+            context: Risk context applied to every outcome
+            ledger_ref_id: Reference attached to each history row
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not outcomes:
+            return True
+        try:
+            with self._get_db() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(_SQL_GET_EWMA_STATE, (agent_did,)).fetchone()
+                if not row:
+                    conn.rollback()
+                    self.logger.error("Agent %s not found", agent_did)
+                    return False
+
+                score, verification_count, created_at, created_epoch = row
+                created_ts = (
+                    created_epoch if created_epoch is not None
+                    else self._parse_timestamp(created_at)
                 )
 
+                first_score = score
+                hist_rows = []
+                for outcome_score in outcomes:
+                    in_probation = self.engine.is_in_probation(
+                        created_ts, verification_count
+                    )
+                    if outcome_score < 0.5:
+                        new_score = self.engine.calculate_violation_penalty(score)
+                    else:
+                        new_score = self.engine.calculate_ewma_update(
+                            score, outcome_score, context
+                        )
+                    if in_probation:
+                        new_score = max(new_score, self.engine.get_probation_floor())
+                    hist_rows.append((
+                        agent_did,
+                        score,
+                        new_score,
+                        new_score - score,
+                        'EWMA_UPDATE',
+                        f"{context.name} (outcome={outcome_score})",
+                        ledger_ref_id
+                    ))
+                    score = new_score
+                    verification_count += 1
+
+                new_stage = self.engine.get_trust_stage(score).name
+                conn.execute(
+                    _SQL_UPDATE_EWMA_BULK,
+                    (score, new_stage, int(time.time()), len(outcomes), agent_did)
+                )
                 conn.commit()
+                self._invalidate_trust(agent_did)
+                for hist_row in hist_rows:
+                    self._record_history(hist_row)
 
                 self.logger.info(
-                    f"Trust updated for {agent_did}: {current_score:.3f} → {new_score:.3f} "
-                    f"(Δ={new_score - current_score:+.3f}, context={context.name})"
+                    "Bulk trust update for %s: %d outcomes, %.3f → %.3f",
+                    agent_did, len(outcomes), first_score, score
                 )
-
                 return True
 
         except Exception as e:
-            self.logger.error(f"Error updating trust for {agent_did}: {e}", exc_info=True)
+            self.logger.error("Error in bulk trust update for %s: %s", agent_did, e, exc_info=True)
             return False
 
     def apply_micro_penalty(
@@ -186,28 +743,29 @@ class TrustManager:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_db() as conn:
                 # Get current state
-                cursor = conn.execute(
-                    """
-                    SELECT trust_score, daily_penalty_sum, penalty_reset_date
-                    FROM agent_registry
-                    WHERE did = ?
-                    """,
-                    (agent_did,)
-                )
+                cursor = conn.execute(_SQL_GET_PENALTY_STATE, (agent_did,))
                 row = cursor.fetchone()
                 if not row:
-                    self.logger.error(f"Agent {agent_did} not found")
+                    self.logger.error("Agent %s not found", agent_did)
                     return False
 
-                current_score, daily_penalty_sum, penalty_reset_date = row
+                current_score, daily_penalty_sum, penalty_reset_date, penalty_reset_day = row
 
-                # Reset daily penalty sum if new day
+                # Reset daily penalty sum if new day. The ordinal column
+                # makes this an int compare; the ISO parse only runs for
+                # rows that predate the migration.
                 today = date.today()
-                reset_date = date.fromisoformat(penalty_reset_date) if penalty_reset_date else today
+                today_ord = today.toordinal()
+                if penalty_reset_day is not None:
+                    reset_day = penalty_reset_day
+                elif penalty_reset_date:
+                    reset_day = date.fromisoformat(penalty_reset_date).toordinal()
+                else:
+                    reset_day = today_ord
 
-                if reset_date < today:
+                if reset_day < today_ord:
                     daily_penalty_sum = 0.0
 
                 # Calculate penalty
@@ -226,7 +784,9 @@ class TrustManager:
                         trust_stage = ?,
                         daily_penalty_sum = ?,
                         penalty_reset_date = ?,
+                        penalty_reset_day = ?,
                         last_trust_update = CURRENT_TIMESTAMP,
+                        last_trust_update_epoch = ?,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE did = ?
                     """,
@@ -235,40 +795,34 @@ class TrustManager:
                         new_stage,
                         daily_penalty_sum + applied_penalty,
                         today.isoformat(),
+                        today_ord,
+                        int(time.time()),
                         agent_did
                     )
                 )
 
-                # Record in trust_updates history
-                conn.execute(
-                    """
-                    INSERT INTO trust_updates (
-                        agent_did, old_score, new_score, delta,
-                        update_type, context, ledger_ref_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        agent_did,
-                        current_score,
-                        new_score,
-                        new_score - current_score,
-                        'MICRO_PENALTY',
-                        f"{penalty_type.name}: {reason}",
-                        ledger_ref_id
-                    )
-                )
-
                 conn.commit()
+                self._invalidate_trust(agent_did)
+                self._record_history((
+                    agent_did,
+                    current_score,
+                    new_score,
+                    new_score - current_score,
+                    'MICRO_PENALTY',
+                    f"{penalty_type.name}: {reason}",
+                    ledger_ref_id
+                ))
 
                 self.logger.warning(
-                    f"Micro-penalty applied to {agent_did}: {current_score:.3f} → {new_score:.3f} "
-                    f"(-{applied_penalty:.3f}, type={penalty_type.name}, daily_sum={daily_penalty_sum + applied_penalty:.3f})"
+                    "Micro-penalty applied to %s: %.3f → %.3f (-%.3f, type=%s, daily_sum=%.3f)",
+                    agent_did, current_score, new_score, applied_penalty,
+                    penalty_type.name, daily_penalty_sum + applied_penalty
                 )
 
                 return True
 
         except Exception as e:
-            self.logger.error(f"Error applying micro-penalty to {agent_did}: {e}", exc_info=True)
+            self.logger.error("Error applying micro-penalty to %s: %s", agent_did, e, exc_info=True)
             return False
 
     def apply_temporal_decay(self, agent_did: str, baseline: float = 0.4) -> bool:
@@ -283,21 +837,17 @@ class TrustManager:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT trust_score, last_trust_update
-                    FROM agent_registry
-                    WHERE did = ?
-                    """,
-                    (agent_did,)
-                )
+            with self._get_db() as conn:
+                cursor = conn.execute(_SQL_GET_DECAY_STATE, (agent_did,))
                 row = cursor.fetchone()
                 if not row:
                     return False
 
-                current_score, last_update = row
-                last_update_ts = self._parse_timestamp(last_update)
+                current_score, last_update, last_update_epoch = row
+                last_update_ts = (
+                    last_update_epoch if last_update_epoch is not None
+                    else self._parse_timestamp(last_update)
+                )
 
                 # Calculate decayed score
                 new_score = self.engine.calculate_temporal_decay(
@@ -313,43 +863,119 @@ class TrustManager:
                 # Update agent_registry
                 new_stage = self.engine.get_trust_stage(new_score).name
                 conn.execute(
-                    """
-                    UPDATE agent_registry
-                    SET trust_score = ?,
-                        trust_stage = ?,
-                        last_trust_update = CURRENT_TIMESTAMP,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE did = ?
-                    """,
-                    (new_score, new_stage, agent_did)
+                    _SQL_UPDATE_SCORE,
+                    (new_score, new_stage, int(time.time()), agent_did)
                 )
 
-                # Record in trust_updates history
-                conn.execute(
-                    """
-                    INSERT INTO trust_updates (
-                        agent_did, old_score, new_score, delta,
-                        update_type, context, ledger_ref_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                conn.commit()
+                self._invalidate_trust(agent_did)
+                self._record_history((
+                    agent_did,
+                    current_score,
+                    new_score,
+                    new_score - current_score,
+                    'TEMPORAL_DECAY',
+                    f"Inactivity drift toward baseline ({baseline})",
+                    None
+                ))
+
+                return True
+
+        except Exception as e:
+            self.logger.error("Error applying temporal decay to %s: %s", agent_did, e, exc_info=True)
+            return False
+
+    def apply_temporal_decay_batch(
+        self,
+        agent_dids: List[str],
+        baseline: float = 0.4
+    ) -> int:
+        """
+        Apply temporal decay to many agents in one transaction.
+
+        Per-agent apply_temporal_decay pays an UPDATE+INSERT+commit each;
+        a nightly sweep over the registry should pay one. Scores come
+        back in a single SELECT ... IN, decay runs through the engine's
+        vectorized kernel, below-threshold deltas are dropped, and the
+        survivors are written with two executemany calls and one commit.
+
+        Args:
+            agent_dids: Agents to sweep
+            baseline: Target baseline score (default 0.4 for T4/Neutral)
+
+        Returns:
+            Number of agents whose score actually changed.
+        """
+        if not agent_dids:
+            return 0
+
+        try:
+            with self._get_db() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                placeholders = ",".join("?" * len(agent_dids))
+                rows = conn.execute(
+                    f"""
+                    SELECT did, trust_score, last_trust_update, last_trust_update_epoch
+                    FROM agent_registry
+                    WHERE did IN ({placeholders})
                     """,
-                    (
-                        agent_did,
-                        current_score,
-                        new_score,
-                        new_score - current_score,
+                    list(agent_dids)
+                ).fetchall()
+                if not rows:
+                    conn.rollback()
+                    return 0
+
+                dids = [r[0] for r in rows]
+                scores = [r[1] for r in rows]
+                last_ts = [
+                    r[3] if r[3] is not None else self._parse_timestamp(r[2])
+                    for r in rows
+                ]
+
+                new_scores = self.engine.calculate_temporal_decay_batch(
+                    scores, last_ts, baseline=baseline
+                )
+
+                now_epoch = int(time.time())
+                upd_rows = []
+                hist_rows = []
+                for did, old, new in zip(dids, scores, new_scores):
+                    new = float(new)
+                    if abs(new - old) < 0.0001:
+                        continue
+                    upd_rows.append((
+                        new,
+                        self.engine.get_trust_stage(new).name,
+                        now_epoch,
+                        did
+                    ))
+                    hist_rows.append((
+                        did,
+                        old,
+                        new,
+                        new - old,
                         'TEMPORAL_DECAY',
                         f"Inactivity drift toward baseline ({baseline})",
                         None
-                    )
-                )
+                    ))
 
-                conn.commit()
+                if not upd_rows:
+                    conn.rollback()
+                    return 0
 
-                return True
+                conn.executemany(_SQL_UPDATE_SCORE, upd_rows)
+                conn.executemany(_SQL_INSERT_HISTORY, hist_rows)
+                conn.commit()
+                self._invalidate_trust(*(r[3] for r in upd_rows))
+                self.logger.info(
+                    "Temporal decay sweep: %d/%d agents decayed",
+                    len(upd_rows), len(rows)
+                )
+                return len(upd_rows)
 
         except Exception as e:
-            self.logger.error(f"Error applying temporal decay to {agent_did}: {e}", exc_info=True)
-            return False
+            self.logger.error("Error in temporal decay sweep: %s", e, exc_info=True)
+            return 0
 
     def get_trust_stage(self, agent_did: str) -> Optional[TrustStage]:
         """
@@ -382,21 +1008,19 @@ class TrustManager:
             List of trust update records
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    """
-                    SELECT *
-                    FROM trust_updates
-                    WHERE agent_did = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                    """,
-                    (agent_did, limit)
-                )
-                return [dict(row) for row in cursor.fetchall()]
+            # Drain any queued writes first so history reads stay
+            # read-your-writes despite the background writer
+            self.flush_history()
+            with self._get_db() as conn:
+                cursor = conn.execute(_SQL_GET_HISTORY, (agent_did, limit))
+                # Plain tuples + one column list from cursor.description:
+                # dict(sqlite3.Row) built a Row object and a column map
+                # per record. (Setting row_factory here also leaked Row
+                # onto every other query on the pooled connection.)
+                cols = [d[0] for d in cursor.description]
+                return [dict(zip(cols, row)) for row in cursor.fetchall()]
         except Exception as e:
-            self.logger.error(f"Error reading trust history for {agent_did}: {e}")
+            self.logger.error("Error reading trust history for %s: %s", agent_did, e)
             return []
 
     def apply_violation_penalty(
@@ -421,7 +1045,7 @@ class TrustManager:
         from datetime import datetime, timedelta
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_db() as conn:
                 # Get current state
                 cursor = conn.execute(
                     "SELECT trust_score FROM agent_registry WHERE did = ?",
@@ -429,7 +1053,7 @@ class TrustManager:
                 )
                 row = cursor.fetchone()
                 if not row:
-                    self.logger.error(f"Agent {agent_did} not found")
+                    self.logger.error("Agent %s not found", agent_did)
                     return False
                 
                 current_score = row[0]
@@ -451,10 +1075,11 @@ class TrustManager:
                         trust_stage = ?,
                         status = 'QUARANTINED',
                         last_trust_update = CURRENT_TIMESTAMP,
+                        last_trust_update_epoch = ?,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE did = ?
                     """,
-                    (new_score, new_stage, agent_did)
+                    (new_score, new_stage, int(time.time()), agent_did)
                 )
                 
                 # Insert into agent_quarantine
@@ -467,44 +1092,27 @@ class TrustManager:
                     (agent_did, end_time, reason)
                 )
                 
-                # Log VIOLATION_PENALTY
-                conn.execute(
-                    """
-                    INSERT INTO trust_updates (
-                        agent_did, old_score, new_score, delta,
-                        update_type, context, ledger_ref_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        agent_did, current_score, new_score, new_score - current_score,
-                        'VIOLATION_PENALTY', reason, ledger_ref_id
-                    )
-                )
-                
-                # Log COOLING_OFF_START
-                conn.execute(
-                    """
-                    INSERT INTO trust_updates (
-                        agent_did, old_score, new_score, delta,
-                        update_type, context, ledger_ref_id
-                    ) VALUES (?, ?, ?, ?, 'COOLING_OFF_START', ?, ?)
-                    """,
-                    (
-                        agent_did, new_score, new_score, 0.0,
-                        f"Duration: {cooling_off_seconds}s (Malicious={is_malicious})",
-                        ledger_ref_id
-                    )
-                )
-                
                 conn.commit()
+                self._invalidate_trust(agent_did)
+                # Log VIOLATION_PENALTY and COOLING_OFF_START
+                self._record_history((
+                    agent_did, current_score, new_score, new_score - current_score,
+                    'VIOLATION_PENALTY', reason, ledger_ref_id
+                ))
+                self._record_history((
+                    agent_did, new_score, new_score, 0.0,
+                    'COOLING_OFF_START',
+                    f"Duration: {cooling_off_seconds}s (Malicious={is_malicious})",
+                    ledger_ref_id
+                ))
                 self.logger.warning(
-                    f"VIOLATION penalty applied to {agent_did}: {current_score:.3f} -> {new_score:.3f}. "
-                    f"Quarantined until {end_time}."
+                    "VIOLATION penalty applied to %s: %.3f -> %.3f. Quarantined until %s.",
+                    agent_did, current_score, new_score, end_time
                 )
                 return True
                 
         except Exception as e:
-            self.logger.error(f"Error applying violation penalty to {agent_did}: {e}", exc_info=True)
+            self.logger.error("Error applying violation penalty to %s: %s", agent_did, e, exc_info=True)
             return False
 
     def update_influence_weights(self) -> bool:
@@ -513,7 +1121,7 @@ class TrustManager:
         This ensures system-wide conservation of influence.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_db() as conn:
                 # Fetch all active agents and their trust scores
                 cursor = conn.execute(
                     "SELECT did, trust_score FROM agent_registry WHERE status = 'ACTIVE'"
@@ -566,11 +1174,11 @@ class TrustManager:
                     )
                 
                 conn.commit()
-                self.logger.info(f"Updated influence weights for {len(agents)} agents (L1 Norm + Anchor Damping).")
+                self.logger.info("Updated influence weights for %d agents (L1 Norm + Anchor Damping).", len(agents))
                 return True
                 
         except Exception as e:
-            self.logger.error(f"Error updating influence weights: {e}", exc_info=True)
+            self.logger.error("Error updating influence weights: %s", e, exc_info=True)
             return False
 
     def _parse_timestamp(self, ts_str: str) -> float:
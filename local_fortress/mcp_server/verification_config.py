@@ -10,11 +10,17 @@ Research Reference: FORMAL_METHODS.md §6
 import os
 import json
 import logging
+import threading
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from enum import Enum
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,11 +31,21 @@ class VerificationMode(Enum):
     DISABLED = "disabled"  # Skip formal verification
 
 
-@dataclass
+# Direct value→member table: a plain dict hit instead of the Enum
+# constructor's lookup machinery on every config deserialization
+_MODE_BY_VALUE = {m.value: m for m in VerificationMode}
+
+
+@dataclass(slots=True, frozen=True)
 class VerificationConfig:
     """
     Configuration for formal verification features.
-    
+
+    Frozen + slotted: instances are read constantly on verification hot
+    paths, so slot descriptors beat __dict__ lookups, and immutability
+    means a config handed out by the loader can be shared freely.
+    Derive changed copies with dataclasses.replace().
+
     Attributes:
         mode: Verification intensity (full/lite/disabled)
         llm_endpoint: Ollama API endpoint for transpilation
@@ -70,19 +86,29 @@ class VerificationConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'VerificationConfig':
         if "mode" in data:
-            data["mode"] = VerificationMode(data["mode"])
+            mode = data["mode"]
+            # Enum constructor fallback keeps member passthrough and the
+            # ValueError on unknown strings
+            data["mode"] = _MODE_BY_VALUE.get(mode) or VerificationMode(mode)
         return cls(**data)
 
 
-# Configuration paths (in order of priority)
-CONFIG_PATHS = [
+# Configuration paths (in order of priority), expanded once at import —
+# empty entries are dropped here so load() skips the per-call filtering
+CONFIG_PATHS = tuple(p for p in [
     # 1. Docker container mount point
     "/config/verification.json",
     # 2. Alongside agents.json
     os.path.expanduser("~/.qorelogic/config/verification.json"),
     # 3. Environment variable override
     os.environ.get("QORELOGIC_VERIFICATION_CONFIG", ""),
-]
+] if p)
+
+# agents.json fallback locations (embedded formal_verification block)
+_AGENTS_PATHS = (
+    "/config/agents.json",
+    os.path.expanduser("~/.qorelogic/config/agents.json"),
+)
 
 
 class VerificationConfigLoader:
@@ -90,64 +116,98 @@ class VerificationConfigLoader:
     Singleton loader for verification configuration.
     """
     _instance: Optional['VerificationConfigLoader'] = None
+    _instance_lock = threading.Lock()
     _config: Optional[VerificationConfig] = None
     _config_path: Optional[str] = None
-    
+    _config_mtime: Optional[float] = None
+
     def __new__(cls):
+        # Double-checked locking: the unlocked read serves the steady
+        # state, the lock closes the creation race between threads
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
-    
+
     def load(self, force_reload: bool = False) -> VerificationConfig:
         """Load configuration from file or return defaults."""
         if self._config and not force_reload:
             return self._config
-        
+
+        # Reload fast path: once a config file has been resolved, re-stat
+        # only that file instead of walking every candidate path. An
+        # unchanged mtime makes reload a single stat syscall.
+        if force_reload and self._config_path:
+            try:
+                mtime = os.stat(self._config_path).st_mtime
+                if self._config is not None and mtime == self._config_mtime:
+                    return self._config
+                config = self._load_from_path(self._config_path)
+                if config is not None:
+                    self._config = config
+                    self._config_mtime = mtime
+                    logger.info(f"Reloaded verification config from {self._config_path}: mode={config.mode.value}")
+                    return config
+            except OSError:
+                # File moved or deleted; fall back to the full path walk
+                pass
+
         # Try each config path
         for path in CONFIG_PATHS:
-            if path and os.path.exists(path):
+            if os.path.exists(path):
                 try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Look for nested formal_verification key or root-level
-                    if "formal_verification" in data:
-                        data = data["formal_verification"]
-                    
-                    self._config = VerificationConfig.from_dict(data)
+                    config = self._load_from_path(path)
+                    if config is None:
+                        continue
+                    self._config = config
                     self._config_path = path
-                    logger.info(f"Loaded verification config from {path}: mode={self._config.mode.value}")
-                    return self._config
-                    
+                    self._config_mtime = os.stat(path).st_mtime
+                    logger.info(f"Loaded verification config from {path}: mode={config.mode.value}")
+                    return config
+
                 except (json.JSONDecodeError, IOError, TypeError) as e:
                     logger.warning(f"Failed to load verification config from {path}: {e}")
                     continue
         
         # Also check agents.json for embedded config
-        agents_paths = [
-            "/config/agents.json",
-            os.path.expanduser("~/.qorelogic/config/agents.json"),
-        ]
-        
-        for path in agents_paths:
-            if path and os.path.exists(path):
+        for path in _AGENTS_PATHS:
+            if os.path.exists(path):
                 try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    if "formal_verification" in data:
-                        self._config = VerificationConfig.from_dict(data["formal_verification"])
-                        self._config_path = path
-                        logger.info(f"Loaded verification config from agents.json: mode={self._config.mode.value}")
-                        return self._config
+                    config = self._load_from_path(path, require_nested=True)
+                    if config is None:
+                        continue
+                    self._config = config
+                    self._config_path = path
+                    self._config_mtime = os.stat(path).st_mtime
+                    logger.info(f"Loaded verification config from agents.json: mode={config.mode.value}")
+                    return config
                 except Exception:
                     continue
-        
+
         # Return defaults
         logger.info("Using default verification config: mode=lite")
         self._config = VerificationConfig()
         return self._config
-    
+
+    @staticmethod
+    def _load_from_path(path: str, require_nested: bool = False) -> Optional[VerificationConfig]:
+        """Parse one config file; None if it holds no verification config."""
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        # Look for nested formal_verification key or root-level
+        if "formal_verification" in data:
+            data = data["formal_verification"]
+        elif require_nested:
+            return None
+
+        return VerificationConfig.from_dict(data)
+
     def get_config(self) -> VerificationConfig:
         """Get current configuration."""
         if self._config is None:
@@ -165,11 +225,22 @@ class VerificationConfigLoader:
         
         try:
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(config.to_dict(), f, indent=2)
+            # Write-to-temp + rename: a reader (or crash) mid-write can
+            # never observe a torn config, and the rename is atomic. No
+            # explicit fsync — this config is reloadable, not
+            # crash-critical, so the page cache flushes on its own time.
+            tmp_path = path + ".tmp"
+            if orjson is not None:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(config.to_dict(), f, indent=2)
+            os.replace(tmp_path, path)
             
             self._config = config
             self._config_path = path
+            self._config_mtime = os.stat(path).st_mtime
             logger.info(f"Saved verification config to {path}")
             return True
         except Exception as e:
@@ -186,25 +257,67 @@ def get_verification_config() -> VerificationConfig:
 def set_verification_mode(mode: VerificationMode) -> bool:
     """Quick setter for verification mode."""
     loader = VerificationConfigLoader()
-    config = loader.get_config()
-    config.mode = mode
+    config = replace(loader.get_config(), mode=mode)
     return loader.save_config(config)
 
 
-def is_full_verification_available() -> bool:
-    """Check if Full mode prerequisites are met."""
-    import shutil
-    
-    # Check for CBMC
-    has_cbmc = shutil.which("cbmc") is not None
-    
-    # Check for Ollama (basic connectivity test)
-    has_ollama = False
-    try:
+# Availability probe cache: the PATH walk for cbmc and the blocking
+# Ollama HTTP round trip (2 s worst case) are far too expensive to pay
+# on every verification request, and neither answer changes quickly.
+_AVAILABILITY_TTL_S = 60.0
+_availability_lock = threading.Lock()
+_availability: Optional[bool] = None
+_availability_ts = 0.0
+_cbmc_checked = False
+_has_cbmc = False
+_ollama_session = None
+
+
+def _get_ollama_session():
+    """Shared keep-alive session so probes reuse one TCP connection."""
+    global _ollama_session
+    if _ollama_session is None:
         import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=2)
-        has_ollama = response.status_code == 200
-    except Exception:
-        pass
-    
-    return has_cbmc and has_ollama
+        _ollama_session = requests.Session()
+    return _ollama_session
+
+
+def is_full_verification_available(force_fresh: bool = False) -> bool:
+    """
+    Check if Full mode prerequisites are met.
+
+    The result is cached for _AVAILABILITY_TTL_S; pass force_fresh=True
+    to re-probe immediately (e.g. right after starting Ollama).
+    """
+    global _availability, _availability_ts, _cbmc_checked, _has_cbmc
+    import time as _time
+
+    now = _time.monotonic()
+    with _availability_lock:
+        if (
+            not force_fresh
+            and _availability is not None
+            and now - _availability_ts < _AVAILABILITY_TTL_S
+        ):
+            return _availability
+
+        # PATH rarely changes within a process; resolve cbmc once
+        if not _cbmc_checked or force_fresh:
+            import shutil
+            _has_cbmc = shutil.which("cbmc") is not None
+            _cbmc_checked = True
+
+        # Check for Ollama (basic connectivity test)
+        has_ollama = False
+        if _has_cbmc:
+            try:
+                response = _get_ollama_session().get(
+                    "http://localhost:11434/api/tags", timeout=2
+                )
+                has_ollama = response.status_code == 200
+            except Exception:
+                pass
+
+        _availability = _has_cbmc and has_ollama
+        _availability_ts = now
+        return _availability
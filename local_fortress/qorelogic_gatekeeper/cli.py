@@ -1,14 +1,19 @@
 import sys
 import os
-import json
-import argparse
-from pathlib import Path
 
 # In a real packaged environment, we would import from the installed package.
 # For now, we assume this file is part of the 'local_fortress' package context
 # or that PYTHONPATH includes the package root.
+#
+# This runs as a git hook, so cold-start latency is user-visible on every
+# commit: everything beyond sys/os is imported inside main() (and the
+# server stack only after the file-existence guard) so --help, bad args
+# and missing files never pay for it.
 
 def main():
+    import argparse
+    from pathlib import Path
+
     print("DEBUG: CLI Starting...")
     parser = argparse.ArgumentParser(description="QoreLogic Gatekeeper - Active Hook")
     parser.add_argument("file", nargs="*", help="Path to the file to audit (Optional if running dashboard)")
@@ -79,9 +84,24 @@ def main():
         # When installed via setup.py, 'mcp_server' should be a top-level package or subpackage.
         # We might need to adjust imports based on how find_packages() sees the dir structure.
         from mcp_server.server import audit_code
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+
+        # Single-pass read: stat gives the size up front so the whole
+        # file arrives in one os.read (no buffered-IO chunking or
+        # realloc) and gets decoded once at the end
+        size = file_path.stat().st_size
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            chunks = []
+            remaining = size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        finally:
+            os.close(fd)
+        content = b"".join(chunks).decode('utf-8')
 
         mode_label = f"[{system_mode.upper()} MODE]"
         if not is_monitoring:
@@ -114,6 +134,7 @@ def main():
             print(f"{Colors.HEADER}QoreLogic Gatekeeper v2.1.0{Colors.ENDC} on {file_path}...")
         
         result_json = audit_code(str(file_path), content)
+        import json
         result = json.loads(result_json)
         
         verdict = result.get('verdict')
@@ -35,55 +35,51 @@ def print_header(title):
 def test_identity_system():
     print_header("Identity Fortress (Argon2id + Rotation)")
     
-    # Use temp keystore
+    # Use temp keystore, injected rather than monkey-patched so the test
+    # is safe to run in parallel with anything touching the real keystore
     with tempfile.TemporaryDirectory() as temp_dir:
-        # Monkey patch keystore dir
-        import mcp_server.identity_manager
-        original_keystore = mcp_server.identity_manager.KEYSTORE_DIR
-        mcp_server.identity_manager.KEYSTORE_DIR = Path(temp_dir)
-        
-        try:
-            # 1. Init Manager
-            id_mgr = IdentityManager(passphrase="secure-test-passphrase")
-            
-            # 2. Create Identity
-            print("[-] Generating Sentinel Identity...")
-            start = time.time()
-            identity = id_mgr.create_agent("Sentinel")
-            duration = time.time() - start
-            print(f"    DID: {identity.did}")
-            print(f"    Key Generation Time: {duration:.4f}s")
+        # 1. Init Manager
+        id_mgr = IdentityManager(
+            passphrase="secure-test-passphrase",
+            keystore_dir=Path(temp_dir),
+        )
+
+        # 2. Create Identity
+        print("[-] Generating Sentinel Identity...")
+        start = time.time()
+        identity = id_mgr.create_agent("Sentinel")
+        duration = time.time() - start
+        print(f"    DID: {identity.did}")
+        print(f"    Key Generation Time: {duration:.4f}s")
             
-            # 3. Verify Keyfile Content (Check for Argon2id)
-            keyfile = Path(temp_dir) / f"{identity.did.replace(':', '_')}.key"
-            with open(keyfile, 'r') as f:
-                data = json.load(f)
+        # 3. Verify Keyfile Content (Check for Argon2id)
+        keyfile = Path(temp_dir) / f"{identity.did.replace(':', '_')}.key"
+        with open(keyfile, 'r') as f:
+            data = json.load(f)
             
-            kdf = data.get("kdf_algorithm", "MISSING")
-            print(f"    KDF Algorithm: {kdf} {'✅' if kdf == 'argon2id' else '❌'}")
+        kdf = data.get("kdf_algorithm", "MISSING")
+        print(f"    KDF Algorithm: {kdf} {'✅' if kdf == 'argon2id' else '❌'}")
             
-            if kdf != 'argon2id':
-                print("    ! WARNING: Argon2id not used. Is argon2-cffi installed?")
+        if kdf != 'argon2id':
+            print("    ! WARNING: Argon2id not used. Is argon2-cffi installed?")
             
-            # 4. Test Signing
-            payload = b"test_payload"
-            signature = id_mgr.sign(identity.did, payload)
-            valid = id_mgr.verify(identity.did, payload, signature)
-            print(f"    Signature Valid: {valid} {'✅' if valid else '❌'}")
+        # 4. Test Signing
+        payload = b"test_payload"
+        signature = id_mgr.sign(identity.did, payload)
+        valid = id_mgr.verify(identity.did, payload, signature)
+        print(f"    Signature Valid: {valid} {'✅' if valid else '❌'}")
             
-            # 5. Key Rotation
-            print("[-] Rotating Key...")
-            new_identity = id_mgr.rotate_key(identity.did)
-            print(f"    New Key Pub: {new_identity.public_key_hex[:16]}...")
-            print(f"    Old Key Pub: {identity.public_key_hex[:16]}...")
+        # 5. Key Rotation
+        print("[-] Rotating Key...")
+        new_identity = id_mgr.rotate_key(identity.did)
+        print(f"    New Key Pub: {new_identity.public_key_hex[:16]}...")
+        print(f"    Old Key Pub: {identity.public_key_hex[:16]}...")
             
-            if new_identity.public_key_hex != identity.public_key_hex:
-                print("    Rotation Successful ✅")
-            else:
-                print("    Rotation Failed ❌")
+        if new_identity.public_key_hex != identity.public_key_hex:
+            print("    Rotation Successful ✅")
+        else:
+            print("    Rotation Failed ❌")
                 
-        finally:
-            mcp_server.identity_manager.KEYSTORE_DIR = original_keystore
 
 def test_trust_dynamics():
     print_header("Trust Dynamics (Loss Aversion)")
@@ -169,8 +165,8 @@ def unsafe_calc(x):
     print(f"    Status: {result.status.value}")
     print(f"    Violations Found: {len(result.violations)}")
     
-    found_div = any("ARITH-001" in v for v in result.violations)
-    found_key = any("CRYPTO-001" in v for v in result.violations)
+    found_div = "ARITH-001" in result.violation_codes
+    found_key = "CRYPTO-001" in result.violation_codes
     
     if found_div and found_key:
         print("    Heuristics Working (DivZero + API Key caught) ✅")
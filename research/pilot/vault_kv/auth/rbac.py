@@ -1,5 +1,6 @@
+import functools
 from enum import Enum
-from typing import List, NamedTuple
+from typing import FrozenSet, NamedTuple
 import logging
 
 logger = logging.getLogger("vault.auth")
@@ -11,11 +12,27 @@ class Role(Enum):
 
 class User(NamedTuple):
     username: str
-    roles: List[Role]
+    # frozenset: membership checks are O(1) instead of a list scan, and
+    # the User tuple stays hashable for caching
+    roles: FrozenSet[Role]
 
 class AccessDeniedError(Exception):
     pass
 
+
+@functools.lru_cache(maxsize=4096)
+def _decide(user: User, required_role: Role) -> bool:
+    """
+    Pure permission decision, memoized per (user, role) pair — the same
+    user hits the same checks on every operation. Hashability comes
+    from User being a NamedTuple with frozenset roles.
+    """
+    roles = user.roles
+    if not isinstance(roles, (frozenset, set)):
+        roles = frozenset(roles)
+    # Sentinel Check: Admin super-permissions
+    return required_role in roles or Role.ADMIN in roles
+
 class RBAC:
     """
     Role-Based Access Control enforcer.
@@ -26,15 +43,23 @@ class RBAC:
         """
         Verifies if the user has the required role.
         """
-        if required_role in user.roles:
-            return True
-        
-        # Sentinel Check: Admin super-permissions
-        if Role.ADMIN in user.roles:
-            return True
-            
-        logger.warning(f"Access denied for user {user.username}. Required: {required_role}")
-        return False
+        try:
+            allowed = _decide(user, required_role)
+        except TypeError:
+            # Legacy callers with list roles are unhashable; decide
+            # without the cache
+            allowed = _decide.__wrapped__(user, required_role)
+
+        # Denials log on every call, cached or not — the audit trail
+        # must not dedupe
+        if not allowed:
+            logger.warning("Access denied for user %s. Required: %s", user.username, required_role)
+        return allowed
+
+    @staticmethod
+    def invalidate_cache():
+        """Drop memoized decisions after a role change."""
+        _decide.cache_clear()
 
     @staticmethod
     def require_role(user: User, required_role: Role):
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 import json
-import urllib.request
-import urllib.error
+import urllib3
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class NetworkConnector(ABC):
     """
@@ -25,6 +30,14 @@ class SimpleHTTPConnector(NetworkConnector):
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
         self.base_url = ""
+        # Persistent pool with keep-alive: urlopen paid a fresh TCP (and
+        # TLS) handshake per call, which dwarfs the POST itself for the
+        # vault's many small sequential requests
+        self._http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=16,
+            retries=Retry(total=2, backoff_factor=0.1),
+        )
 
     def connect(self, host: str, port: int) -> bool:
         self.base_url = f"http://{host}:{port}"
@@ -40,14 +53,22 @@ class SimpleHTTPConnector(NetworkConnector):
             
         url = f"{self.base_url}{endpoint}"
         headers = {'Content-Type': 'application/json'}
-        payload = json.dumps(data).encode('utf-8')
-        
-        req = urllib.request.Request(url, data=payload, headers=headers, method='POST')
-        
+        # orjson emits bytes directly, skipping the dumps+encode copy
+        if orjson is not None:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data).encode('utf-8')
+
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                result = response.read().decode('utf-8')
-                return json.loads(result)
-        except urllib.error.URLError as e:
+            response = self._http.request(
+                'POST', url,
+                body=payload,
+                headers=headers,
+                timeout=self.timeout,
+            )
+            if orjson is not None:
+                return orjson.loads(response.data)
+            return json.loads(response.data)
+        except urllib3.exceptions.HTTPError as e:
             print(f"Network error: {e}")
             return {"error": str(e)}
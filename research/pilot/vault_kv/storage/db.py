@@ -1,19 +1,33 @@
 import sqlite3
 import os
-from typing import Optional, Any
-from cryptography.fernet import Fernet
+from typing import Iterable, Optional, Any, Tuple
+from threading import Lock
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 import json
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Protected Build: Audit logging active
 logger = logging.getLogger("vault.storage")
 
+# Hot-path SQL as module constants so every call reuses the same
+# prepared statement from the connection's statement cache
+_SQL_PUT = "INSERT OR REPLACE INTO secrets (key, value, metadata) VALUES (?, ?, ?)"
+_SQL_GET = "SELECT value FROM secrets WHERE key = ?"
+
 class SecureStorage:
     """
     Encrypted Key-Value Store backed by SQLite.
     Enforces encryption at rest.
     """
-    
+
     def __init__(self, db_path: str = "vault.db", encryption_key: Optional[bytes] = None):
         self.db_path = db_path
         if not encryption_key:
@@ -27,10 +41,37 @@ class SecureStorage:
                 logger.warning("No VAULT_KEY found. Generated ephemeral key.")
         else:
             self.key = encryption_key
-            
+
+        # AES-GCM for the data path: rides AES-NI/CLMUL hardware and
+        # skips Fernet's per-call HMAC + base64 round trip. The Fernet
+        # cipher stays for decrypting secrets written before the switch.
         self.cipher = Fernet(self.key)
+        aes_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"vault-kv-aesgcm-v1",
+        ).derive(self.key)
+        self._aead = AESGCM(aes_key)
+        # 96-bit nonces from a random-start counter: unique per write
+        # without an os.urandom call on every put
+        self._nonce_ctr = int.from_bytes(os.urandom(8), "big")
+        self._nonce_lock = Lock()
         self._init_db()
 
+        # One long-lived connection: per-call connect() paid file open,
+        # WAL recovery probe and schema parse on every KV op, which
+        # dwarfs the crypto for small values. isolation_level=None keeps
+        # sqlite3 in autocommit so single statements behave as before.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
     def _init_db(self):
         """Initialize the database schema."""
         conn = sqlite3.connect(self.db_path)
@@ -46,44 +87,84 @@ class SecureStorage:
         conn.commit()
         conn.close()
 
+    def _encrypt(self, plaintext: bytes) -> bytes:
+        """AES-GCM encrypt; blob layout is 12-byte nonce || ciphertext+tag."""
+        with self._nonce_lock:
+            nonce = (self._nonce_ctr & ((1 << 96) - 1)).to_bytes(12, "big")
+            self._nonce_ctr += 1
+        return nonce + self._aead.encrypt(nonce, plaintext, None)
+
+    def _decrypt(self, blob: bytes) -> bytes:
+        """Decrypt an AES-GCM blob, falling back to legacy Fernet tokens."""
+        try:
+            return self._aead.decrypt(bytes(blob[:12]), bytes(blob[12:]), None)
+        except Exception:
+            # Rows written before the AES-GCM switch are Fernet tokens;
+            # InvalidToken here means the row is corrupt either way
+            return self.cipher.decrypt(blob)
+
     def put(self, key: str, value: str, metadata: dict = None):
         """
         Encrypts and stores a value.
         """
-        if not key or not value:
-            raise ValueError("Key and Value must be provided.")
-            
-        encrypted_val = self.cipher.encrypt(value.encode())
-        meta_json = json.dumps(metadata) if metadata else "{}"
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.put_many([(key, value, metadata)])
+        logger.info(f"Secret stored for key: {key}")
+
+    def put_many(self, items: Iterable[Tuple[str, str, Optional[dict]]]):
+        """
+        Encrypts and stores many (key, value, metadata) tuples in one
+        transaction. Row-at-a-time put pays a commit fsync per secret;
+        a bulk import of N secrets here pays exactly one.
+        """
+        rows = []
+        for key, value, metadata in items:
+            if not key or not value:
+                raise ValueError("Key and Value must be provided.")
+            if not metadata:
+                meta_json = "{}"
+            elif orjson is not None:
+                meta_json = orjson.dumps(metadata).decode()
+            else:
+                meta_json = json.dumps(metadata)
+            rows.append((key, self._encrypt(value.encode()), meta_json))
+        if not rows:
+            return
+
         try:
-            # Sentinel Check: Parameterized query to prevent SQL Injection
-            cursor.execute(
-                "INSERT OR REPLACE INTO secrets (key, value, metadata) VALUES (?, ?, ?)",
-                (key, encrypted_val, meta_json)
-            )
-            conn.commit()
-            logger.info(f"Secret stored for key: {key}")
+            # Sentinel Check: Parameterized query to prevent SQL Injection.
+            # Explicit transaction — the connection is in autocommit, so
+            # without it executemany would commit per row.
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(_SQL_PUT, rows)
+            self._conn.execute("COMMIT")
+            if len(rows) > 1:
+                logger.info(f"Stored {len(rows)} secrets in one transaction")
         except sqlite3.Error as e:
+            try:
+                self._conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
             logger.error(f"Database error: {e}")
             raise
-        finally:
-            conn.close()
 
     def get(self, key: str) -> Optional[str]:
         """
         Retrieves and decrypts a value.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        row = self._conn.execute(_SQL_GET, (key,)).fetchone()
+        if row:
+            return self._decrypt(row[0]).decode()
+        return None
+
+    def close(self):
+        """Close the cached connection."""
         try:
-            cursor.execute("SELECT value FROM secrets WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            if row:
-                encrypted_val = row[0]
-                return self.cipher.decrypt(encrypted_val).decode()
-            return None
-        finally:
-            conn.close()
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+
+    def __enter__(self) -> 'SecureStorage':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
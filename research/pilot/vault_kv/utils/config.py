@@ -1,28 +1,57 @@
+import functools
 import os
 from typing import Optional
 
+# Frozenset: membership is a hash probe instead of a tuple scan
+_TRUE_SET = frozenset({'true', '1', 'yes', 'on'})
+
+
+# Module-level cached lookups — hot keys polled in loops collapse to a
+# single dict hit. Config.reload() clears them after environment changes.
+@functools.lru_cache(maxsize=256)
+def _get(key: str, default: Optional[str]) -> Optional[str]:
+    return os.environ.get(key, default)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_int(key: str, default: int) -> int:
+    val = os.environ.get(key)
+    if val is None:
+        return default
+    try:
+        return int(val)
+    except ValueError:
+        return default
+
+
+@functools.lru_cache(maxsize=256)
+def _get_bool(key: str, default: bool) -> bool:
+    val = os.environ.get(key)
+    if val is None:
+        return default
+    return val.lower() in _TRUE_SET
+
+
 class Config:
     """
     Basic configuration loader.
     """
-    
+
     @staticmethod
     def get(key: str, default: Optional[str] = None) -> Optional[str]:
-        return os.environ.get(key, default)
+        return _get(key, default)
 
     @staticmethod
     def get_int(key: str, default: int = 0) -> int:
-        val = os.environ.get(key)
-        if val is None:
-            return default
-        try:
-            return int(val)
-        except ValueError:
-            return default
+        return _get_int(key, default)
 
     @staticmethod
     def get_bool(key: str, default: bool = False) -> bool:
-        val = os.environ.get(key)
-        if val is None:
-            return default
-        return val.lower() in ('true', '1', 'yes', 'on')
+        return _get_bool(key, default)
+
+    @staticmethod
+    def reload():
+        """Drop cached values after the environment changes."""
+        _get.cache_clear()
+        _get_int.cache_clear()
+        _get_bool.cache_clear()
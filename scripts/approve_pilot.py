@@ -7,21 +7,57 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Optional streaming JSON parser; the raw_decode fallback below walks
+# the array element by element either way
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from local_fortress.mcp_server.server import get_pending_approvals, approve_l3
 
+
+def _iter_pending(pending_json):
+    """
+    Yield pending-approval dicts one at a time instead of materializing
+    the whole list — an overnight queue of thousands of entries costs
+    one element of memory at a time, not the full structure.
+    """
+    if ijson is not None:
+        import io
+        yield from ijson.items(io.BytesIO(pending_json.encode()), 'item')
+        return
+    # Fallback: step a JSONDecoder through the top-level array manually,
+    # decoding one element per raw_decode call
+    decoder = json.JSONDecoder()
+    pos = pending_json.find('[')
+    if pos < 0:
+        return
+    pos += 1
+    length = len(pending_json)
+    while pos < length:
+        while pos < length and pending_json[pos] in ' \t\r\n,':
+            pos += 1
+        if pos >= length or pending_json[pos] == ']':
+            return
+        obj, pos = decoder.raw_decode(pending_json, pos)
+        yield obj
+
+
 def approve_all():
     pending_json = get_pending_approvals()
-    pending = json.loads(pending_json)
-    
-    print(f"Found {len(pending)} pending approvals.")
-    
-    for p in pending:
+
+    count = 0
+    for p in _iter_pending(pending_json):
         q_id = p['queue_id']
         reason = p['reason']
         print(f"Approving [ID: {q_id}] Reason: {reason}")
-        
+
         result = approve_l3(q_id, True, "Pilot deployment approved by Overseer.")
         print(f"Result: {result}")
+        count += 1
+
+    print(f"Processed {count} pending approvals.")
 
 if __name__ == "__main__":
     approve_all()
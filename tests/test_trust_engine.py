@@ -16,11 +16,29 @@ class TestTrustEngine(unittest.TestCase):
         # 0.5 * 0.94 + 1.0 * 0.06 = 0.47 + 0.06 = 0.53
         self.assertAlmostEqual(new_score, 0.53)
 
+    def test_ewma_update_batch_matches_scalar(self):
+        currents = [0.5, 0.2, 0.9]
+        outcomes = [1.0, 0.0, 0.5]
+        batch = self.engine.calculate_ewma_update_batch(
+            currents, outcomes, TrustContext.HIGH_RISK
+        )
+        for got, c, o in zip(batch, currents, outcomes):
+            expected = self.engine.calculate_ewma_update(c, o, TrustContext.HIGH_RISK)
+            self.assertAlmostEqual(float(got), expected, places=5)
+
     def test_transitive_trust(self):
         # Path [0.9, 0.9] -> 0.9 * 0.9 * 0.5 = 0.405
         res = self.engine.calculate_transitive_trust([0.9, 0.9])
         self.assertAlmostEqual(res, 0.405)
 
+    def test_transitive_trust_batch(self):
+        paths = [[0.9, 0.9], [0.8], [], [0.9, 0.9, 0.9, 0.9]]
+        res = self.engine.calculate_transitive_trust_batch(paths)
+        self.assertAlmostEqual(res[0], 0.405, places=5)
+        self.assertAlmostEqual(res[1], 0.8, places=5)
+        self.assertEqual(res[2], 0.0)
+        self.assertEqual(res[3], 0.0)  # beyond MAX_HOPS trust evaporates
+
     def test_trust_stages(self):
         # Boundary checks
         self.assertEqual(self.engine.get_trust_stage(0.2), TrustStage.CBT)
@@ -1,13 +1,21 @@
 import unittest
+
+import pytest
+
 from local_fortress.mcp_server.contract_verifier import ContractVerifier
 
+@pytest.mark.z3
 class TestZ3Viability(unittest.TestCase):
     """
     Phase 9.1: Viability Validation using Formal Verification (Z3).
     """
 
-    def setUp(self):
-        self.verifier = ContractVerifier(enable_z3=True)
+    @classmethod
+    def setUpClass(cls):
+        # One verifier for the whole class: Z3 context construction is
+        # the dominant fixed cost, and verify_with_z3 push()/pop()s the
+        # shared solver so each test sees a clean constraint stack
+        cls.verifier = ContractVerifier(enable_z3=True)
 
     def test_z3_valid_trust_score(self):
         """Verify that a standard trust score (0.0-1.0) is satisfiable."""